@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import re
+
+from BTrees.IIBTree import IITreeSet
+from BTrees.IIBTree import intersection
+from bika.lims import api
+from Products.CMFPlone.utils import safe_unicode
+from senaite.core.catalog import SETUP_CATALOG
+from zope.annotation.interfaces import IAnnotations
+
+# Request annotation key for the resolved antibiotic classes
+ANTIBIOTIC_CLASSES_CACHE_KEY = "senaite.abx.antibiotic_classes"
+
+# Request annotation key for the resolved antibiotic panels
+ANTIBIOTIC_PANELS_CACHE_KEY = "senaite.abx.antibiotic_panels"
+
+
+def normalize(value):
+    """Returns the value passed in as a lower-cased, utf-8 encoded string
+    without leading/trailing whitespaces and with inner whitespaces collapsed,
+    so it can be used for catalog lookups and uniqueness checks
+    """
+    if not value:
+        return ""
+    value = safe_unicode(value).strip().lower()
+    value = re.sub(r"\s+", " ", value, flags=re.UNICODE)
+    return value.encode("utf-8")
+
+
+def get_code_key(system, code):
+    """Returns the normalized key of the code from the coding system passed
+    in, e.g. "whonet:cip"
+    """
+    system = normalize(system)
+    code = normalize(code)
+    if not all([system, code]):
+        return ""
+    return "{}:{}".format(system, code)
+
+
+def parse_code(value):
+    """Returns a tuple (system, code) for an external code in the form
+    "SYSTEM:CODE", or None if the value is not in that form
+    """
+    system, sep, code = safe_unicode(value or "").partition(u":")
+    if not all([sep, system.strip(), code.strip()]):
+        return None
+    return system.strip(), code.strip()
+
+
+def resolve_codes(system, codes):
+    """Resolves the codes from the coding system passed in to antibiotic UIDs
+    in a single pass over the hash map of the antibiotic registry.
+
+    Returns a tuple (resolved, unknown), where resolved is a dict of code ->
+    antibiotic UID and unknown is the list of the codes not resolved
+    """
+    # imported here to prevent a circular import
+    from senaite.abx.registry import get_registry
+    return get_registry().resolve_codes(system, codes)
+
+
+def get_request_cache(key):
+    """Returns a dict bound to the current request for the key passed in, so
+    that values can be cached during the lifetime of the request. Returns a
+    new and empty dict if there is no request available
+    """
+    request = api.get_request()
+    if request is None:
+        return {}
+    annotations = IAnnotations(request)
+    cache = annotations.get(key)
+    if cache is None:
+        cache = annotations[key] = {}
+    return cache
+
+
+def get_antibiotic_classes(uids):
+    """Returns a dict of UID -> AntibioticClass object for the UIDs passed in.
+
+    UIDs not resolved yet during the current request are resolved with a
+    single catalog query. UIDs that cannot be resolved are not included in
+    the returned dict
+    """
+    uids = filter(api.is_uid, set(uids or []))
+    cache = get_request_cache(ANTIBIOTIC_CLASSES_CACHE_KEY)
+    missing = filter(lambda uid: uid not in cache, uids)
+    if missing:
+        query = {
+            "portal_type": "AntibioticClass",
+            "UID": missing,
+        }
+        for brain in api.search(query, SETUP_CATALOG):
+            cache[api.get_uid(brain)] = api.get_object(brain)
+        # remember the UIDs that cannot be resolved as well
+        for uid in missing:
+            cache.setdefault(uid, None)
+
+    classes = [(uid, cache[uid]) for uid in uids if cache[uid] is not None]
+    return dict(classes)
+
+
+def get_antibiotic_class(uid):
+    """Returns the AntibioticClass object for the UID passed in or None
+    """
+    return get_antibiotic_classes([uid]).get(uid)
+
+
+def get_antibiotic_panels(uids):
+    """Returns a dict of UID -> tuple of antibiotic records for the antibiotic
+    panels passed in, with the antibiotics in the order of the panel.
+
+    Panels not resolved yet during the current request are resolved with a
+    single catalog query. The antibiotics are looked up in the antibiotic
+    registry, so no further queries are done. Panels that cannot be resolved
+    are not included in the returned dict
+    """
+    # imported here to prevent a circular import
+    from senaite.abx.registry import get_registry
+
+    uids = filter(api.is_uid, set(uids or []))
+    cache = get_request_cache(ANTIBIOTIC_PANELS_CACHE_KEY)
+    missing = filter(lambda uid: uid not in cache, uids)
+    if missing:
+        snapshot = get_registry().get_snapshot()
+        query = {
+            "portal_type": "AntibioticPanel",
+            "UID": missing,
+        }
+        for brain in api.search(query, SETUP_CATALOG):
+            records = map(snapshot.get_record, brain.getRawAntibiotics or [])
+            cache[api.get_uid(brain)] = tuple(filter(None, records))
+        # remember the UIDs that cannot be resolved as well
+        for uid in missing:
+            cache.setdefault(uid, None)
+
+    panels = [(uid, cache[uid]) for uid in uids if cache[uid] is not None]
+    return dict(panels)
+
+
+def get_antibiotic_panel(uid):
+    """Returns the tuple of antibiotic records of the antibiotic panel with
+    the UID passed in or None
+    """
+    return get_antibiotic_panels([uid]).get(uid)
+
+
+def get_antibiotics_for_class(class_uid, active_only=True, query=None):
+    """Returns the catalog brains of the antibiotics assigned to the antibiotic
+    class (or list of classes) passed in, answered from the antibiotic class
+    reference index. Additional catalog query parameters can be passed in
+    """
+    catalog_query = {
+        "portal_type": "Antibiotic",
+        "getRawAntibioticClass": class_uid,
+        "sort_on": "sortable_title",
+        "sort_order": "ascending",
+    }
+    if active_only:
+        catalog_query["is_active"] = True
+    catalog_query.update(query or {})
+    return api.search(catalog_query, SETUP_CATALOG)
+
+
+def get_index_rids(catalog, index_name, value):
+    """Returns the set of record ids the index has for the value passed in
+    """
+    index = catalog._catalog.getIndex(index_name)
+    result = index._apply_index({index_name: value})
+    return result[0] if result else IITreeSet()
+
+
+def get_antibiotic_counts(is_active=None):
+    """Returns a dict of antibiotic class UID -> number of antibiotics.
+
+    Counts are computed from the antibiotic class reference index only, so
+    neither brains nor objects are loaded. If is_active is True or False,
+    only active or inactive antibiotics are counted
+    """
+    catalog = api.get_tool(SETUP_CATALOG)
+    index = catalog._catalog.getIndex("getRawAntibioticClass")
+
+    restrict = None
+    if is_active is not None:
+        restrict = get_index_rids(catalog, "is_active", is_active)
+
+    counts = {}
+    for uid, rids in index._index.items():
+        if isinstance(rids, int):
+            # the index stores single record ids as integers
+            rids = IITreeSet((rids, ))
+        if restrict is not None:
+            rids = intersection(rids, restrict)
+        counts[uid] = len(rids)
+    return counts
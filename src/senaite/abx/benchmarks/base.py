@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import json
+import os
+import time
+import unittest
+
+import transaction
+from plone.app.testing import setRoles
+from plone.app.testing import TEST_USER_ID
+from senaite.abx.testing import BENCHMARK_TESTING
+
+# Environment variable with the path of the results file
+OUTPUT_ENV = "SENAITE_ABX_BENCHMARK_OUTPUT"
+DEFAULT_OUTPUT = "senaite.abx-benchmarks.json"
+
+
+def get_output_path():
+    """Returns the path of the file the results are written to
+    """
+    return os.environ.get(OUTPUT_ENV, DEFAULT_OUTPUT)
+
+
+def write_result(name, seconds, **extra):
+    """Adds or replaces the result of the benchmark to the results file
+    """
+    path = get_output_path()
+    results = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            results = json.load(f)
+    result = {"seconds": seconds}
+    result.update(extra)
+    results.setdefault("benchmarks", {})[name] = result
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+class BenchmarkTestCase(unittest.TestCase):
+    """Base class for benchmarks on the seeded benchmark layer
+    """
+    layer = BENCHMARK_TESTING
+
+    def setUp(self):
+        self.portal = self.layer["portal"]
+        self.request = self.layer["request"]
+        setRoles(self.portal, TEST_USER_ID, ["Manager"])
+        self.volume = {
+            "antibiotics": self.layer["antibiotics_volume"],
+            "classes": self.layer["classes_volume"],
+        }
+
+    def measure(self, name, func, repeat=3, commit=False):
+        """Runs the function repeat times and writes the best and average run
+        time to the results file. Returns the result of the last run
+        """
+        timings = []
+        result = None
+        for num in range(repeat):
+            start = time.time()
+            result = func()
+            if commit:
+                transaction.commit()
+            timings.append(time.time() - start)
+        write_result(name, min(timings),
+                     average=sum(timings) / len(timings),
+                     repeat=repeat,
+                     volume=self.volume)
+        return result
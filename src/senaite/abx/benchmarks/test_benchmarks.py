@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.benchmarks.base import BenchmarkTestCase
+from senaite.abx.benchmarks.base import write_result
+from senaite.abx.browser.content.antibioticfolder import AntibioticFolderView
+from senaite.abx.content.antibiotic import IAntibioticSchema
+from senaite.abx.seeding import HASH_KEY
+from senaite.abx.setuphandlers import setup_antibiotic_classes
+from senaite.abx.setuphandlers import setup_antibiotics
+from senaite.abx.upgrade.v01_02_000 import remove_antibiotic_behavior
+from zope.annotation.interfaces import IAnnotations
+
+
+class Data(object):
+    """Form data passed to the schema invariants
+    """
+
+    def __init__(self, context, **kwargs):
+        self.__context__ = context
+        self.__dict__.update(kwargs)
+
+
+def get_invariant(name):
+    """Returns the invariant of the antibiotic schema with the given name
+    """
+    invariants = IAntibioticSchema.queryTaggedValue("invariants", [])
+    return filter(lambda inv: inv.__name__ == name, invariants)[0]
+
+
+class TestAntibioticFolderView(BenchmarkTestCase):
+    """Rendering of the antibiotics listing per review state
+    """
+
+    def render(self, review_state, lazy=True):
+        folder = api.get_setup().get("antibiotics")
+        view = AntibioticFolderView(folder, self.request)
+        self.request.form["{}_review_state".format(view.form_id)] = \
+            review_state
+        view.lazy_categories = lazy
+        view.update()
+        view.before_render()
+        return view.folderitems()
+
+    def test_render(self):
+        for review_state in ("default", "inactive", "all"):
+            for lazy in (True, False):
+                name = "listing.antibiotics.{}.{}".format(
+                    review_state, "lazy" if lazy else "flat")
+                self.measure(name, lambda: self.render(review_state, lazy))
+
+
+class TestValidators(BenchmarkTestCase):
+    """Latency of the uniqueness invariants of the antibiotic schema
+    """
+
+    def test_validate_title(self):
+        folder = api.get_setup().get("antibiotics")
+        data = Data(folder, title=u"Benchmark Antibiotic New")
+        validate = get_invariant("validate_title")
+        self.measure("validators.validate_title",
+                     lambda: validate(data), repeat=10)
+
+    def test_validate_abbreviation(self):
+        folder = api.get_setup().get("antibiotics")
+        data = Data(folder, abbreviation=u"BANEW")
+        validate = get_invariant("validate_abbreviation")
+        self.measure("validators.validate_abbreviation",
+                     lambda: validate(data), repeat=10)
+
+
+class TestSetupHandler(BenchmarkTestCase):
+    """Run time of the default data setup on fresh and existing sites
+    """
+
+    def test_fresh_site(self):
+        write_result("setup_handler.fresh", self.layer["install_seconds"],
+                     volume={"antibiotics": 0, "classes": 0})
+
+    def test_existing_site(self):
+        setup = api.get_setup()
+        folders = [setup.get("antibiotic_classes"), setup.get("antibiotics")]
+
+        def run(unchanged=True):
+            if not unchanged:
+                # forget the applied datasets to force a full plan
+                for folder in folders:
+                    IAnnotations(folder).pop(HASH_KEY, None)
+            setup_antibiotic_classes(self.portal)
+            setup_antibiotics(self.portal)
+
+        self.measure("setup_handler.existing.changed",
+                     lambda: run(unchanged=False))
+        self.measure("setup_handler.existing.unchanged", run)
+
+
+class TestMigrations(BenchmarkTestCase):
+    """Run time of the upgrade steps iterating over all antibiotics
+    """
+
+    def test_remove_antibiotic_behavior(self):
+        setup_tool = api.get_tool("portal_setup")
+        self.measure("upgrade.remove_antibiotic_behavior",
+                     lambda: remove_antibiotic_behavior(setup_tool),
+                     repeat=1)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import bisect
+import collections
+from array import array
+
+from BTrees.OOBTree import OOBTree
+from bika.lims import api
+from senaite.abx.api import get_request_cache
+from senaite.core.catalog import SETUP_CATALOG
+from zope.annotation.interfaces import IAnnotations
+
+# Antibiotic annotation key of the breakpoint tables
+ANNOTATION_KEY = "senaite.abx.breakpoints"
+
+# Request annotation key for the loaded breakpoint tables
+BREAKPOINTS_CACHE_KEY = "senaite.abx.breakpoints"
+
+# Test methods
+MIC = "mic"
+ZONE = "zone"
+METHODS = (MIC, ZONE)
+
+# Guidelines -> whether the resistant breakpoint is inclusive. EUCAST
+# defines R as MIC > R breakpoint (zone < R), CLSI as MIC >= R (zone <= R)
+GUIDELINES = {
+    "EUCAST": False,
+    "CLSI": True,
+}
+
+# Interpretation categories, in ascending order of MIC
+SUSCEPTIBLE = "S"
+INTERMEDIATE = "I"
+RESISTANT = "R"
+CATEGORIES = (SUSCEPTIBLE, INTERMEDIATE, RESISTANT)
+
+# Identifies a breakpoint table of an antibiotic
+BreakpointKey = collections.namedtuple(
+    "BreakpointKey", ["guideline", "version", "organism_group", "method"])
+
+
+class Breakpoint(object):
+    """Susceptible and resistant breakpoints of a table, ready to classify
+    values.
+
+    Zone diameters decrease with resistance, so they are negated, together
+    with their breakpoints, to be classified the same way as MIC values: in
+    ascending order susceptible, intermediate and resistant
+    """
+
+    def __init__(self, key, values):
+        self.key = key
+        self.sign = -1.0 if key.method == ZONE else 1.0
+        self.inclusive = GUIDELINES[key.guideline]
+        susceptible, resistant = values
+        self.thresholds = array(
+            "d", [self.sign * susceptible, self.sign * resistant])
+
+    def classify(self, values):
+        """Returns the list of categories for the values passed in. Values
+        that are None are returned as None
+        """
+        thresholds = self.thresholds
+        resistant = thresholds[1]
+        sign = self.sign
+        inclusive = self.inclusive
+        search = bisect.bisect_left
+
+        def get_category(value):
+            if value is None:
+                return None
+            value = sign * float(value)
+            position = search(thresholds, value)
+            if inclusive and position == 1 and value == resistant:
+                position = 2
+            return CATEGORIES[position]
+
+        return map(get_category, values)
+
+
+def make_key(guideline, version, organism_group, method):
+    """Returns the BreakpointKey for the values passed in
+    """
+    if guideline not in GUIDELINES:
+        raise ValueError("Unknown guideline: {}".format(guideline))
+    if method not in METHODS:
+        raise ValueError("Unknown method: {}".format(method))
+    return BreakpointKey(guideline, str(version), organism_group, method)
+
+
+def get_breakpoint_tables(antibiotic, create=False):
+    """Returns the persistent mapping of key -> breakpoints of the antibiotic
+    or None if it has no breakpoints and create is False
+    """
+    annotations = IAnnotations(antibiotic)
+    tables = annotations.get(ANNOTATION_KEY)
+    if tables is None and create:
+        tables = annotations[ANNOTATION_KEY] = OOBTree()
+    return tables
+
+
+def set_breakpoint(antibiotic, guideline, version, organism_group, method,
+                   susceptible, resistant):
+    """Sets the susceptible and resistant breakpoints of the antibiotic for
+    the guideline version, organism group and method passed in
+    """
+    key = make_key(guideline, version, organism_group, method)
+    susceptible = float(susceptible)
+    resistant = float(resistant)
+    if method == MIC and susceptible > resistant:
+        raise ValueError("MIC breakpoints: S must be lower or equal than R")
+    if method == ZONE and susceptible < resistant:
+        raise ValueError("Zone breakpoints: S must be greater or equal than R")
+    tables = get_breakpoint_tables(antibiotic, create=True)
+    tables[tuple(key)] = array("d", [susceptible, resistant])
+
+
+def remove_breakpoint(antibiotic, guideline, version, organism_group, method):
+    """Removes the breakpoints of the antibiotic for the guideline version,
+    organism group and method passed in
+    """
+    key = make_key(guideline, version, organism_group, method)
+    tables = get_breakpoint_tables(antibiotic)
+    if tables is not None and tuple(key) in tables:
+        del tables[tuple(key)]
+
+
+def get_breakpoint(antibiotic, guideline, version, organism_group, method):
+    """Returns the Breakpoint of the antibiotic for the guideline version,
+    organism group and method passed in or None
+    """
+    key = make_key(guideline, version, organism_group, method)
+    tables = get_breakpoint_tables(antibiotic) or {}
+    values = tables.get(tuple(key))
+    if values is None:
+        return None
+    return Breakpoint(key, values)
+
+
+def get_breakpoints(uids, key):
+    """Returns a dict of antibiotic UID -> Breakpoint for the key passed in.
+
+    Antibiotics whose tables were not loaded yet during the current request
+    are resolved with a single catalog query
+    """
+    cache = get_request_cache(BREAKPOINTS_CACHE_KEY)
+    missing = filter(lambda uid: (uid, key) not in cache, set(uids))
+    if missing:
+        query = {
+            "portal_type": "Antibiotic",
+            "UID": missing,
+        }
+        for brain in api.search(query, SETUP_CATALOG):
+            obj = api.get_object(brain)
+            tables = get_breakpoint_tables(obj) or {}
+            values = tables.get(tuple(key))
+            if values is not None:
+                cache[(api.get_uid(brain), key)] = Breakpoint(key, values)
+        # remember the antibiotics without breakpoints as well
+        for uid in missing:
+            cache.setdefault((uid, key), None)
+
+    breakpoints = [(uid, cache[(uid, key)]) for uid in uids]
+    return dict(filter(lambda item: item[1] is not None, breakpoints))
+
+
+def interpret(antibiotic_uids, values, guideline, version, organism_group,
+              method):
+    """Returns the list of categories (S, I, R) for the values passed in,
+    each one measured for the antibiotic at the same position of
+    antibiotic_uids. Values without value or breakpoints are returned as None.
+
+    Values are grouped by antibiotic, so each breakpoint table is loaded once
+    and all its values are classified in a single call
+    """
+    if len(antibiotic_uids) != len(values):
+        raise ValueError("Number of antibiotics and values do not match")
+
+    key = make_key(guideline, version, organism_group, method)
+    breakpoints = get_breakpoints(antibiotic_uids, key)
+
+    positions = collections.defaultdict(list)
+    for position, uid in enumerate(antibiotic_uids):
+        positions[uid].append(position)
+
+    categories = [None] * len(values)
+    for uid, indexes in positions.items():
+        breakpoint = breakpoints.get(uid)
+        if breakpoint is None:
+            continue
+        results = breakpoint.classify([values[index] for index in indexes])
+        for index, category in zip(indexes, results):
+            categories[index] = category
+    return categories
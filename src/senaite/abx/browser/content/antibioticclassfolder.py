@@ -21,7 +21,16 @@
 import collections
 
 from bika.lims import _
+from bika.lims import api
 from bika.lims.utils import get_link_for
+from plone.memoize import view
+from senaite.abx import messageFactory as _abx
+from senaite.abx.api import get_antibiotic_counts
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.browser.content.antibioticfolder import get_lazy_children
+from senaite.abx.browser.content.antibioticfolder import make_antibiotic_item
+from senaite.abx.instrumentation import instrumented
+from senaite.abx.instrumentation import timed_folderitem
 from senaite.app.listing import ListingView
 from senaite.core.catalog import SETUP_CATALOG
 
@@ -41,11 +50,17 @@ class AntibioticClassFolderView(ListingView):
             "sort_order": "ascending",
         }
 
-        self.context_actions = {
-            _("Add"): {
+        self.context_actions = collections.OrderedDict((
+            (_("Add"), {
                 "url": "++add++AntibioticClass",
-                "icon": "add.png"}
-            }
+                "icon": "add.png"}),
+            (_abx("Export"), {
+                "url": "@@export",
+                "icon": "export.png"}),
+            (_abx("Reassign"), {
+                "url": "@@reassign",
+                "icon": "edit.png"}),
+        ))
 
         self.show_select_column = True
 
@@ -58,6 +73,14 @@ class AntibioticClassFolderView(ListingView):
                 "title": _("Description"),
                 "index": "Description"
             }),
+            ("active", {
+                "title": _abx("Active antibiotics"),
+                "sortable": False,
+            }),
+            ("inactive", {
+                "title": _abx("Inactive antibiotics"),
+                "sortable": False,
+            }),
         ))
 
         self.review_states = [
@@ -65,13 +88,17 @@ class AntibioticClassFolderView(ListingView):
                 "id": "default",
                 "title": _("Active"),
                 "contentFilter": {"is_active": True},
-                "transitions": [],
+                "transitions": [{"id": "deactivate"}],
+                "custom_transitions": [{
+                    "id": "deactivate_cascade",
+                    "title": _abx("Deactivate with antibiotics"),
+                }],
                 "columns": self.columns.keys(),
             }, {
                 "id": "inactive",
                 "title": _("Inactive"),
                 "contentFilter": {'is_active': False},
-                "transitions": [],
+                "transitions": [{"id": "activate"}],
                 "columns": self.columns.keys(),
             }, {
                 "id": "all",
@@ -91,6 +118,22 @@ class AntibioticClassFolderView(ListingView):
         """
         super(AntibioticClassFolderView, self).before_render()
 
+    @view.memoize
+    def get_counts(self):
+        """Returns a tuple of dicts of antibiotic class UID -> number of
+        active and inactive antibiotics, computed from the antibiotic class
+        reference index for all classes at once
+        """
+        return (get_antibiotic_counts(is_active=True),
+                get_antibiotic_counts(is_active=False))
+
+    @instrumented
+    def folderitems(self):
+        """Returns the folderitems of the antibiotic classes
+        """
+        return super(AntibioticClassFolderView, self).folderitems()
+
+    @timed_folderitem
     def folderitem(self, obj, item, index):
         """Service triggered each time an item is iterated in folderitems.
         The use of this service prevents the extra-loops in child objects.
@@ -99,11 +142,32 @@ class AntibioticClassFolderView(ListingView):
             the template
         :index: current index of the item
         """
+        uid = api.get_uid(obj)
+        active, inactive = self.get_counts()
+        item["active"] = active.get(uid, 0)
+        item["inactive"] = inactive.get(uid, 0)
         item["replace"]["Title"] = get_link_for(obj)
+        if item["active"] or item["inactive"]:
+            item["children"] = get_lazy_children(uid)
+        return item
+
+    def make_child_item(self, brain, parent_uid):
+        """Returns the folderitem of an antibiotic of the class passed in
+        """
+        item = make_antibiotic_item(brain, parent=parent_uid)
+        item.update({
+            "active": "",
+            "inactive": "",
+            # antibiotics cannot be selected in this listing
+            "disabled": True,
+        })
+        item["replace"]["Title"] = get_link_for(brain)
         return item
 
+    @instrumented
     def get_children_hook(self, parent_uid, child_uids=None):
         """Hook to get the children of an item
         """
-        super(AntibioticClassFolderView, self).get_children_hook(
-            parent_uid, child_uids=child_uids)
+        brains = get_antibiotics_for_class(parent_uid, active_only=False)
+        return map(lambda brain: self.make_child_item(brain, parent_uid),
+                   brains)
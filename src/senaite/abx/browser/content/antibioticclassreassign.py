@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from plone.protect import CheckAuthenticator
+from Products.CMFPlone.utils import safe_unicode
+from Products.Five.browser import BrowserView
+from Products.Five.browser.pagetemplatefile import ViewPageTemplateFile
+from senaite.abx import messageFactory as _
+from senaite.abx.importer import DEFAULT_CHUNK_SIZE
+from senaite.abx.instrumentation import instrumented
+from senaite.abx.jobs import submit
+from senaite.abx.reassign import reassign_antibiotics
+from senaite.core.catalog import SETUP_CATALOG
+
+
+class AntibioticClassReassignView(BrowserView):
+    """Assigns the antibiotics of a class, or a list of antibiotics, to
+    another antibiotic class
+    """
+    template = ViewPageTemplateFile("templates/antibioticclassreassign.pt")
+
+    def __init__(self, context, request):
+        super(AntibioticClassReassignView, self).__init__(context, request)
+        self.job_id = None
+
+    @instrumented
+    def __call__(self):
+        form = self.request.form
+        if form.get("submitted"):
+            CheckAuthenticator(self.request)
+            self.reassign(form.get("target"),
+                          source=form.get("source"),
+                          uids=form.get("uids"),
+                          deactivate_source=form.get("deactivate_source"),
+                          background=form.get("background"))
+        return self.template()
+
+    def get_antibiotic_classes(self):
+        """Returns a list of dicts with the uid and title of the antibiotic
+        classes, sorted by title
+        """
+        query = {
+            "portal_type": "AntibioticClass",
+            "sort_on": "sortable_title",
+            "sort_order": "ascending",
+        }
+        brains = api.search(query, SETUP_CATALOG)
+        return [{"uid": api.get_uid(brain), "title": api.get_title(brain)}
+                for brain in brains]
+
+    def get_uids(self, value):
+        """Returns the list of UIDs from the whitespace or comma separated
+        value passed in
+        """
+        if not value:
+            return None
+        value = value.replace(",", " ")
+        return filter(api.is_uid, value.split())
+
+    def reassign(self, target, source=None, uids=None,
+                 deactivate_source=False, background=False):
+        """Assigns the antibiotics to the target class
+        """
+        if not target:
+            return self.add_status_message(
+                _("No target class selected"), level="error")
+
+        uids = self.get_uids(uids)
+        if not any([source, uids]):
+            return self.add_status_message(
+                _("Select a source class or enter the antibiotic UIDs"),
+                level="error")
+
+        params = {
+            "source": source or None,
+            "uids": uids,
+            "deactivate_source": bool(deactivate_source),
+            "chunk_size": DEFAULT_CHUNK_SIZE,
+        }
+        if background:
+            self.job_id = submit("reassign_antibiotics", target=target,
+                                 **params)
+            return self.add_status_message(
+                _("Reassignment of antibiotics scheduled"))
+
+        try:
+            reassigned = reassign_antibiotics(target, commit=True, **params)
+        except ValueError as e:
+            return self.add_status_message(
+                safe_unicode(str(e)), level="error")
+
+        self.add_status_message(
+            _("${count} antibiotics reassigned",
+              mapping={"count": reassigned}))
+
+    def add_status_message(self, message, level="info"):
+        """Set a portal status message
+        """
+        return self.context.plone_utils.addPortalMessage(message, level)
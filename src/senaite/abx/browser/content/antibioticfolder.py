@@ -22,12 +22,62 @@ import collections
 
 from bika.lims import _ as _c
 from bika.lims import api
+from bika.lims.utils import get_link
 from bika.lims.utils import get_link_for
+from bika.lims.utils import t
 from plone.memoize import view
+from Products.CMFPlone.utils import safe_unicode
 from senaite.abx import messageFactory as _
+from senaite.abx.api import get_antibiotic_counts
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.instrumentation import instrumented
+from senaite.abx.instrumentation import timed_folderitem
 from senaite.app.listing import ListingView
 from senaite.core.catalog import SETUP_CATALOG
 
+# Parent UID of the category row for antibiotics without class
+UNCATEGORIZED = "uncategorized"
+
+
+def make_antibiotic_item(brain, parent=""):
+    """Returns an empty folderitem for the antibiotic brain passed in
+    """
+    review_state = api.get_review_status(brain)
+    return {
+        "uid": api.get_uid(brain),
+        "id": api.get_id(brain),
+        "url": api.get_url(brain),
+        "title": api.get_title(brain),
+        "Title": api.get_title(brain),
+        "Description": brain.Description,
+        "review_state": review_state,
+        "state_class": "state-{}".format(review_state),
+        "replace": {},
+        "before": {},
+        "after": {},
+        "choices": {},
+        "class": {},
+        "allow_edit": [],
+        "required": [],
+        "children": [],
+        "parent": parent,
+        "disabled": False,
+    }
+
+
+def get_lazy_children(uid):
+    """Returns the children placeholder of a category row. The antibiotics
+    are fetched in get_children_hook on expand, so the listing only needs a
+    non-empty list to render the toggle
+    """
+    # senaite.app.listing has no expandable flag or children count: a row is
+    # only expandable if its "children" list is not empty (has_item_children
+    # in the listing table). On expand, the list is posted as child_uids to
+    # the get_children endpoint, which calls get_children_hook with the
+    # parent UID. The hooks ignore child_uids, so the row's own UID is a
+    # placeholder that never resolves to a child
+    return [uid]
+
 
 class AntibioticFolderView(ListingView):
     """Antibiotics listing view
@@ -44,18 +94,31 @@ class AntibioticFolderView(ListingView):
             "sort_order": "ascending",
         }
 
-        self.context_actions = {
-            _c("Add"): {
+        self.context_actions = collections.OrderedDict((
+            (_c("Add"), {
                 "url": "++add++Antibiotic",
                 "icon": "add.png"
-            }
-        }
+            }),
+            (_("Import"), {
+                "url": "@@import",
+                "icon": "import.png"
+            }),
+            (_("Export"), {
+                "url": "@@export",
+                "icon": "export.png"
+            }),
+        ))
 
         self.show_select_column = True
         self.categories = []
         self.show_categories = True
         self.expand_all_categories = False
 
+        # Render only a row per antibiotic class on initial load and fetch
+        # the antibiotics of a class when the row is expanded
+        self.lazy_categories = True
+        self.lazy = False
+
         self.columns = collections.OrderedDict((
             ("Title", {
                 "title": _c("Title"),
@@ -63,9 +126,11 @@ class AntibioticFolderView(ListingView):
             }),
             ("abbreviation", {
                 "title": _("Abbreviation"),
+                "index": "abbreviation",
             }),
             ("category", {
                 "title": _("Class"),
+                "index": "sortable_class_title",
             }),
             ("Description", {
                 "title": _c("Description"),
@@ -78,13 +143,13 @@ class AntibioticFolderView(ListingView):
                 "id": "default",
                 "title": _c("Active"),
                 "contentFilter": {"is_active": True},
-                "transitions": [],
+                "transitions": [{"id": "deactivate"}],
                 "columns": self.columns.keys(),
             }, {
                 "id": "inactive",
                 "title": _c("Inactive"),
                 "contentFilter": {'is_active': False},
-                "transitions": [],
+                "transitions": [{"id": "activate"}],
                 "columns": self.columns.keys(),
             }, {
                 "id": "all",
@@ -106,18 +171,129 @@ class AntibioticFolderView(ListingView):
         brains = api.search(query)
         return map(api.get_title, brains)
 
+    def get_request_value(self, key, default=None):
+        """Returns the value of the listing parameter from the request
+        """
+        key = "{}_{}".format(self.form_id, key)
+        return self.request.get(key, default)
+
+    def get_review_state_filter(self):
+        """Returns the content filter of the current review state
+        """
+        review_state = getattr(self, "review_state", None) or {}
+        return review_state.get("contentFilter", {})
+
+    def is_lazy(self):
+        """Returns whether only the antibiotic class rows have to be rendered
+        """
+        if not self.lazy_categories:
+            return False
+        # search results and custom sort orders are rendered as a flat list
+        if self.get_request_value("filter"):
+            return False
+        sort_on = self.get_request_value("sort_on")
+        return sort_on in (None, "", "sortable_title")
+
     def update(self):
         """Update hook
         """
-        # Group the items by category (AntibioticClass)
-        self.categories = self.get_categories()
+        self.lazy = self.is_lazy()
+        self.show_categories = not self.lazy
+        if not self.lazy:
+            # Group the items by category (AntibioticClass)
+            self.categories = self.get_categories()
         super(AntibioticFolderView, self).update()
 
+    @instrumented
+    def folderitems(self):
+        """Returns the antibiotic class rows in lazy mode or the antibiotics
+        otherwise
+        """
+        if not self.lazy:
+            return super(AntibioticFolderView, self).folderitems()
+        return self.get_category_items()
+
+    def make_category_item(self, uid, title, count, link=None):
+        """Returns a folderitem for an antibiotic class row
+        """
+        item = {
+            "uid": uid,
+            "id": uid,
+            "title": title,
+            "Title": title,
+            "abbreviation": "",
+            "category": "",
+            "Description": "",
+            "replace": {},
+            "before": {},
+            "after": {},
+            "choices": {},
+            "class": {},
+            "allow_edit": [],
+            "required": [],
+            "children": get_lazy_children(uid),
+            "parent": "",
+            # antibiotic classes cannot be selected in this listing
+            "disabled": True,
+        }
+        item["replace"]["Title"] = u"{} ({})".format(
+            safe_unicode(link or title), count)
+        return item
+
+    @view.memoize
+    def get_antibiotic_classes(self):
+        """Returns the catalog brains of all antibiotic classes
+        """
+        query = {
+            "portal_type": "AntibioticClass",
+            "sort_on": "sortable_title",
+            "sort_order": "ascending",
+        }
+        return api.search(query, SETUP_CATALOG)
+
+    def get_uncategorized_query(self):
+        """Returns the catalog query of the antibiotics for the current review
+        state that are not assigned to any of the existing antibiotic classes
+        """
+        query = dict(self.contentFilter, **self.get_review_state_filter())
+        class_uids = map(api.get_uid, self.get_antibiotic_classes())
+        if class_uids:
+            query["getRawAntibioticClass"] = {"not": class_uids}
+        return query
+
+    def get_category_items(self):
+        """Returns a row per antibiotic class with the number of antibiotics
+        it contains for the current review state
+        """
+        is_active = self.get_review_state_filter().get("is_active")
+        counts = get_antibiotic_counts(is_active=is_active)
+
+        items = []
+        for brain in self.get_antibiotic_classes():
+            uid = api.get_uid(brain)
+            count = counts.get(uid)
+            if not count:
+                continue
+            item = self.make_category_item(
+                uid, api.get_title(brain), count, link=get_link_for(brain))
+            items.append(item)
+
+        # antibiotics without class or assigned to a class that is gone
+        uncategorized = len(api.search(self.get_uncategorized_query(),
+                                       SETUP_CATALOG))
+        if uncategorized > 0:
+            item = self.make_category_item(
+                UNCATEGORIZED, t(_("No class")), uncategorized)
+            items.append(item)
+
+        return items
+
     def before_render(self):
         """Before template render hook
         """
         super(AntibioticFolderView, self).before_render()
 
+    @timed_folderitem
     def folderitem(self, obj, item, index):
         """Service triggered each time an item is iterated in folderitems.
         The use of this service prevents the extra-loops in child objects.
@@ -126,18 +302,32 @@ class AntibioticFolderView(ListingView):
             the template
         :index: current index of the item
         """
-        obj = api.get_object(obj)
+        # Build the row from catalog metadata only, so that neither the
+        # antibiotic nor its class have to be woken up
         item["replace"]["Title"] = get_link_for(obj)
-        item["abbreviation"] = obj.getAbbreviation()
-        antibiotic_class = obj.getAntibioticClass()
+        item["abbreviation"] = obj.getAbbreviation
         item["category"] = _("Other")
-        if antibiotic_class:
-            item["category"] = api.get_title(antibiotic_class)
-            item["replace"]["category"] = get_link_for(antibiotic_class)
+        class_title = obj.getAntibioticClassTitle
+        if class_title:
+            class_url = self.request.physicalPathToURL(
+                obj.getAntibioticClassPath)
+            item["category"] = class_title
+            item["replace"]["category"] = get_link(class_url, class_title)
         return item
 
+    @instrumented
     def get_children_hook(self, parent_uid, child_uids=None):
         """Hook to get the children of an item
         """
-        super(AntibioticFolderView, self).get_children_hook(
-            parent_uid, child_uids=child_uids)
+        review_state_filter = self.get_review_state_filter()
+        if parent_uid == UNCATEGORIZED:
+            brains = api.search(self.get_uncategorized_query(), SETUP_CATALOG)
+        else:
+            brains = get_antibiotics_for_class(
+                parent_uid, active_only=False, query=review_state_filter)
+
+        children = []
+        for num, brain in enumerate(brains):
+            item = make_antibiotic_item(brain, parent=parent_uid)
+            children.append(self.folderitem(brain, item, num))
+        return children
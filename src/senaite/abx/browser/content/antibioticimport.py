@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import shutil
+
+from bika.lims import api
+from plone.protect import CheckAuthenticator
+from Products.CMFPlone.utils import safe_unicode
+from Products.Five.browser import BrowserView
+from Products.Five.browser.pagetemplatefile import ViewPageTemplateFile
+from senaite.abx import messageFactory as _
+from senaite.abx.importer import CREATED
+from senaite.abx.importer import DEFAULT_CHUNK_SIZE
+from senaite.abx.importer import FORMATS
+from senaite.abx.importer import import_antibiotics
+from senaite.abx.importer import read
+from senaite.abx.instrumentation import instrumented
+from senaite.abx.jobs import submit
+from ZODB.blob import Blob
+
+
+class AntibioticImportView(BrowserView):
+    """Imports antibiotics from a CSV or JSON file
+    """
+    template = ViewPageTemplateFile("templates/antibioticimport.pt")
+
+    def __init__(self, context, request):
+        super(AntibioticImportView, self).__init__(context, request)
+        self.report = []
+        self.formats = FORMATS
+        self.chunk_size = DEFAULT_CHUNK_SIZE
+        self.job_id = None
+
+    @instrumented
+    def __call__(self):
+        form = self.request.form
+        if form.get("submitted"):
+            CheckAuthenticator(self.request)
+            self.import_file(form.get("import_file"),
+                             fmt=form.get("format", "csv"),
+                             chunk_size=form.get("chunk_size"),
+                             background=form.get("background"))
+        return self.template()
+
+    def import_file(self, import_file, fmt="csv", chunk_size=None,
+                    background=False):
+        """Imports the antibiotics from the uploaded file. If background is
+        True, the import is run as a background job
+        """
+        if not import_file:
+            return self.add_status_message(
+                _("No file selected"), level="error")
+        if fmt not in self.formats:
+            return self.add_status_message(
+                _("Format not supported"), level="error")
+
+        self.chunk_size = api.to_int(chunk_size, DEFAULT_CHUNK_SIZE)
+        import_file.seek(0)
+        if background:
+            return self.submit_import(import_file, fmt=fmt)
+        records = read(import_file, fmt=fmt)
+        try:
+            self.report = import_antibiotics(self.context, records,
+                                             chunk_size=self.chunk_size,
+                                             commit=True)
+        except ValueError as e:
+            return self.add_status_message(
+                _("Cannot read file: ${error}",
+                  mapping={"error": safe_unicode(str(e))}),
+                level="error")
+
+        created = len(filter(lambda r: r["status"] == CREATED, self.report))
+        self.add_status_message(
+            _("${created} of ${total} antibiotics imported",
+              mapping={"created": created, "total": len(self.report)}))
+
+    def submit_import(self, import_file, fmt="csv"):
+        """Stores the uploaded file as a blob and schedules its import as a
+        background job
+        """
+        upload = Blob()
+        with upload.open("w") as blob_file:
+            shutil.copyfileobj(import_file, blob_file)
+        self.job_id = submit("import_antibiotics",
+                             folder=api.get_path(self.context),
+                             upload=upload,
+                             fmt=fmt,
+                             chunk_size=self.chunk_size)
+        filename = getattr(import_file, "filename", None) or u""
+        self.add_status_message(
+            _("Import of ${filename} scheduled",
+              mapping={"filename": safe_unicode(filename)}))
+
+    def add_status_message(self, message, level="info"):
+        """Set a portal status message
+        """
+        return self.context.plone_utils.addPortalMessage(message, level)
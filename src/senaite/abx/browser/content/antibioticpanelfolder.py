@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import collections
+
+from bika.lims import _ as _c
+from bika.lims.utils import get_link_for
+from plone.memoize import view
+from senaite.abx import messageFactory as _
+from senaite.abx.instrumentation import instrumented
+from senaite.abx.instrumentation import timed_folderitem
+from senaite.abx.registry import get_registry
+from senaite.app.listing import ListingView
+from senaite.core.catalog import SETUP_CATALOG
+
+
+class AntibioticPanelFolderView(ListingView):
+    """Antibiotic panels listing view
+    """
+
+    def __init__(self, context, request):
+        super(AntibioticPanelFolderView, self).__init__(context, request)
+
+        self.catalog = SETUP_CATALOG
+
+        self.contentFilter = {
+            "portal_type": "AntibioticPanel",
+            "sort_on": "sortable_title",
+            "sort_order": "ascending",
+        }
+
+        self.context_actions = collections.OrderedDict((
+            (_c("Add"), {
+                "url": "++add++AntibioticPanel",
+                "icon": "add.png"}),
+        ))
+
+        self.show_select_column = True
+
+        self.columns = collections.OrderedDict((
+            ("Title", {
+                "title": _c("Title"),
+                "index": "sortable_title"
+            }),
+            ("antibiotics", {
+                "title": _("Antibiotics"),
+                "sortable": False,
+            }),
+            ("Description", {
+                "title": _c("Description"),
+                "index": "Description"
+            }),
+        ))
+
+        self.review_states = [
+            {
+                "id": "default",
+                "title": _c("Active"),
+                "contentFilter": {"is_active": True},
+                "transitions": [{"id": "deactivate"}],
+                "columns": self.columns.keys(),
+            }, {
+                "id": "inactive",
+                "title": _c("Inactive"),
+                "contentFilter": {'is_active': False},
+                "transitions": [{"id": "activate"}],
+                "columns": self.columns.keys(),
+            }, {
+                "id": "all",
+                "title": _c("All"),
+                "contentFilter": {},
+                "columns": self.columns.keys(),
+            },
+        ]
+
+    @view.memoize
+    def get_snapshot(self):
+        """Returns the snapshot of the antibiotic registry
+        """
+        return get_registry().get_snapshot()
+
+    @instrumented
+    def folderitems(self):
+        """Returns the folderitems of the antibiotic panels
+        """
+        return super(AntibioticPanelFolderView, self).folderitems()
+
+    @timed_folderitem
+    def folderitem(self, obj, item, index):
+        """Service triggered each time an item is iterated in folderitems.
+        The use of this service prevents the extra-loops in child objects.
+        :obj: the instance of the class to be foldered
+        :item: dict containing the properties of the object to be used by
+            the template
+        :index: current index of the item
+        """
+        # resolve the antibiotics from the registry, so neither the panel nor
+        # the antibiotics have to be woken up
+        snapshot = self.get_snapshot()
+        uids = obj.getRawAntibiotics or []
+        records = filter(None, map(snapshot.get_record, uids))
+        abbreviations = map(lambda r: r.abbreviation or r.title, records)
+        item["replace"]["Title"] = get_link_for(obj)
+        item["antibiotics"] = ", ".join(abbreviations)
+        return item
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import collections
+import csv
+import json
+from cStringIO import StringIO
+
+from bika.lims import api
+from Products.CMFPlone.utils import safe_unicode
+from Products.Five.browser import BrowserView
+from senaite.abx.instrumentation import instrumented
+from senaite.core.catalog import SETUP_CATALOG
+
+# Number of brains to process before writing to the response
+CHUNK_SIZE = 500
+
+# Content filters of the listing review states
+REVIEW_STATES = {
+    "default": {"is_active": True},
+    "inactive": {"is_active": False},
+    "all": {},
+}
+
+
+def to_utf8(value):
+    """Returns the value as an utf-8 encoded string
+    """
+    if not value:
+        return ""
+    return safe_unicode(value).encode("utf-8")
+
+
+class ExportView(BrowserView):
+    """Streams the brains of the portal type as CSV or JSON.
+
+    Request parameters:
+
+    - format: "csv" (default) or "json"
+    - fields: comma-separated names of the fields to export
+    - review_state: "default" (active), "inactive" or "all"
+
+    Values are read from the catalog metadata only, so no objects are woken
+    up and the memory used stays constant regardless of the number of items
+    """
+    portal_type = None
+    filename = "export"
+
+    def get_fields(self):
+        """Returns an ordered dict of field name -> callable that returns the
+        value of the field for a given brain
+        """
+        return collections.OrderedDict((
+            ("uid", api.get_uid),
+            ("id", api.get_id),
+            ("title", api.get_title),
+            ("description", lambda brain: brain.Description),
+            ("review_state", api.get_review_status),
+        ))
+
+    @instrumented
+    def __call__(self):
+        form = self.request.form
+        fmt = form.get("format", "csv")
+        if fmt not in ("csv", "json"):
+            fmt = "csv"
+
+        # projection of fields
+        fields = self.get_fields()
+        names = filter(None, form.get("fields", "").split(","))
+        names = filter(lambda name: name in fields, names) or fields.keys()
+        fields = collections.OrderedDict([(n, fields[n]) for n in names])
+
+        query = {
+            "portal_type": self.portal_type,
+            "sort_on": "sortable_title",
+            "sort_order": "ascending",
+        }
+        review_state = form.get("review_state", "all")
+        query.update(REVIEW_STATES.get(review_state, {}))
+
+        response = self.request.response
+        if fmt == "json":
+            content_type = "application/json"
+            chunks = self.generate_json(query, fields)
+        else:
+            content_type = "text/csv"
+            chunks = self.generate_csv(query, fields)
+
+        filename = "{}.{}".format(self.filename, fmt)
+        response.setHeader("Content-Type", "{}; charset=utf-8".format(
+            content_type))
+        response.setHeader("Content-Disposition",
+                           "attachment; filename={}".format(filename))
+        for chunk in chunks:
+            response.write(chunk)
+        return ""
+
+    def iter_brains(self, query):
+        """Yields the brains for the query passed in page by page, releasing
+        the memory used by the ZODB cache after each page
+        """
+        brains = api.search(query, SETUP_CATALOG)
+        jar = api.get_portal()._p_jar
+        for start in range(0, len(brains), CHUNK_SIZE):
+            for brain in brains[start:start + CHUNK_SIZE]:
+                yield brain
+            jar.cacheGC()
+
+    def iter_records(self, query, fields):
+        """Yields a list of utf-8 values per brain for the fields passed in
+        """
+        for brain in self.iter_brains(query):
+            yield [to_utf8(getter(brain)) for getter in fields.values()]
+
+    def generate_csv(self, query, fields):
+        """Yields chunks of CSV lines
+        """
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(fields.keys())
+        for num, record in enumerate(self.iter_records(query, fields), 1):
+            writer.writerow(record)
+            if num % CHUNK_SIZE == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        yield output.getvalue()
+
+    def generate_json(self, query, fields):
+        """Yields chunks of a JSON array of objects
+        """
+        names = fields.keys()
+        output = StringIO()
+        output.write("[")
+        for num, record in enumerate(self.iter_records(query, fields), 1):
+            if num > 1:
+                output.write(",")
+            output.write(json.dumps(dict(zip(names, record))))
+            if num % CHUNK_SIZE == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
+        output.write("]")
+        yield output.getvalue()
+
+
+class AntibioticExportView(ExportView):
+    """Exports antibiotics
+    """
+    portal_type = "Antibiotic"
+    filename = "antibiotics"
+
+    def get_fields(self):
+        """Returns the fields of antibiotics
+        """
+        fields = super(AntibioticExportView, self).get_fields()
+        fields.update((
+            ("abbreviation", lambda b: b.getAbbreviation),
+            ("antibiotic_class", lambda b: b.getAntibioticClassTitle),
+            ("antibiotic_class_uid", lambda b: b.getRawAntibioticClass),
+            ("external_codes",
+             lambda b: " ".join(b.getExternalCodes or [])),
+        ))
+        return fields
+
+
+class AntibioticClassExportView(ExportView):
+    """Exports antibiotic classes
+    """
+    portal_type = "AntibioticClass"
+    filename = "antibiotic_classes"
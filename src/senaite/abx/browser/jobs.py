@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import json
+
+from Products.Five.browser import BrowserView
+from senaite.abx.jobs import get_job
+from senaite.abx.jobs import get_job_info
+from senaite.abx.jobs import get_latest_jobs
+
+# Number of jobs returned when no job id is given
+LATEST_JOBS = 20
+
+
+class JobsView(BrowserView):
+    """Returns the progress of the senaite.abx background jobs as JSON.
+
+    Request parameters:
+
+    - id: the id of the job. If omitted, the latest jobs are returned
+    """
+
+    def __call__(self):
+        job_id = self.request.form.get("id")
+        if job_id:
+            record = get_job(job_id)
+            if record is None:
+                self.request.response.setStatus(404)
+                data = {"error": "Job not found: {}".format(job_id)}
+            else:
+                data = get_job_info(record)
+        else:
+            records = get_latest_jobs(LATEST_JOBS)
+            data = {"items": map(get_job_info, records)}
+
+        response = self.request.response
+        response.setHeader("Content-Type", "application/json")
+        response.setHeader("Cache-Control", "no-cache")
+        return json.dumps(data)
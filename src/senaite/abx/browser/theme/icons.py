@@ -18,8 +18,12 @@
 # Copyright 2020-2025 by it's authors.
 # Some rights reserved, see README and LICENSE.
 
+import hashlib
 import os
+import time
 
+from App.Common import rfc1123_date
+from App.config import getConfiguration
 from plone.resource.interfaces import IResourceDirectory
 from senaite.core.browser.globals.interfaces import IIconProvider
 from senaite.core.browser.globals.interfaces import ISenaiteTheme
@@ -29,6 +33,61 @@ from zope.interface import implementer
 
 ICON_BASE_URL = "++plone++senaite.abx.static/assets/icons"
 
+# Lifetime in seconds of the icons requested with a fingerprint (1 year)
+ICON_MAX_AGE = 31536000
+
+# Icon map computed once per process
+_icons = {}
+
+
+def is_development_mode():
+    """Returns whether Zope runs in development (debug) mode
+    """
+    return getConfiguration().debug_mode
+
+
+def get_icons():
+    """Returns a dict of icon name -> URL of the icon.
+
+    The URLs carry a fingerprint of the file contents, so they change when the
+    icon changes and can be cached by clients without revalidation. The map
+    is computed once per process, unless Zope runs in development mode
+    """
+    global _icons
+    if _icons and not is_development_mode():
+        return _icons
+
+    icons = {}
+    static_dir = getUtility(
+        IResourceDirectory, name=u"++plone++senaite.abx.static")
+    icon_dir = static_dir["assets"]["icons"]
+    for icon in icon_dir.listDirectory():
+        name, ext = os.path.splitext(icon)
+        fingerprint = hashlib.md5(icon_dir.readFile(icon)).hexdigest()[:12]
+        url = "{}/{}?v={}".format(ICON_BASE_URL, icon, fingerprint)
+        icons[name] = url
+        icons[icon] = url
+
+    _icons = icons
+    return _icons
+
+
+def set_cache_headers(event):
+    """Sets long-lived cache headers to the responses of icons requested with
+    a fingerprint, as their URLs change whenever the icon changes
+    """
+    request = event.request
+    if ICON_BASE_URL not in request.get("PATH_INFO", ""):
+        return
+    if not request.form.get("v"):
+        return
+    response = request.response
+    if response.getStatus() != 200:
+        return
+    response.setHeader(
+        "Cache-Control", "public, max-age={}".format(ICON_MAX_AGE))
+    response.setHeader("Expires", rfc1123_date(time.time() + ICON_MAX_AGE))
+
 
 @implementer(IIconProvider)
 class IconProvider(object):
@@ -39,12 +98,4 @@ class IconProvider(object):
         self.context = context
 
     def icons(self):
-        icons = {}
-        static_dir = getUtility(
-            IResourceDirectory, name=u"++plone++senaite.abx.static")
-        icon_dir = static_dir["assets"]["icons"]
-        for icon in icon_dir.listDirectory():
-            name, ext = os.path.splitext(icon)
-            icons[name] = "{}/{}".format(ICON_BASE_URL, icon)
-            icons[icon] = "{}/{}".format(ICON_BASE_URL, icon)
-        return icons
+        return dict(get_icons())
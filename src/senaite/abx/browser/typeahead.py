@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import json
+
+from bika.lims import api
+from Products.Five.browser import BrowserView
+from senaite.abx.registry import get_registry
+
+# Default and maximum number of matches returned
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+
+class AntibioticTypeaheadView(BrowserView):
+    """Returns the antibiotics whose abbreviation or title start with the
+    search term as JSON.
+
+    Request parameters:
+
+    - q: the search term
+    - limit: the maximum number of matches (default 10, max 50)
+    - inactive: include inactive antibiotics if set
+
+    Matches are looked up in the in-memory antibiotic registry, so the catalog
+    is not queried on every keystroke
+    """
+
+    def __call__(self):
+        form = self.request.form
+        term = form.get("q", "")
+        limit = api.to_int(form.get("limit"), DEFAULT_LIMIT)
+        limit = min(max(limit, 1), MAX_LIMIT)
+        active_only = not form.get("inactive")
+
+        records = get_registry().search(
+            term, limit=limit, active_only=active_only)
+        items = map(self.to_dict, records)
+
+        response = self.request.response
+        response.setHeader("Content-Type", "application/json")
+        response.setHeader("Cache-Control", "no-cache")
+        return json.dumps({"term": term, "items": items})
+
+    def to_dict(self, record):
+        """Returns the JSON-serializable representation of the record
+        """
+        return {
+            "uid": record.uid,
+            "title": record.title,
+            "abbreviation": record.abbreviation,
+            "antibiotic_class": record.class_uid,
+            "is_active": record.is_active,
+        }
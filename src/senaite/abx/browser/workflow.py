@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims.browser.workflow import WorkflowActionGenericAdapter
+from bika.lims.interfaces import IWorkflowActionUIDsAdapter
+from senaite.abx import messageFactory as _
+from senaite.abx.jobs import submit
+from senaite.abx.workflow import deactivate_classes
+from senaite.abx.workflow import do_action_for_uids
+from zope.interface import implementer
+
+# Number of selected objects above which the transition is run as a
+# background job
+JOB_THRESHOLD = 1000
+
+
+@implementer(IWorkflowActionUIDsAdapter)
+class WorkflowActionBatchAdapter(WorkflowActionGenericAdapter):
+    """Performs the transition to the selected items in batches.
+
+    Objects are woken up batch by batch and the indexing queue is processed
+    at the end of each batch. Selections larger than JOB_THRESHOLD are
+    handed off to a background job, that commits after each batch, so the
+    request never commits halfway
+    """
+
+    def __call__(self, action, uids):
+        if len(uids) > JOB_THRESHOLD:
+            job_id = self.submit_action(action, uids)
+            message = _("Changes of ${count} items scheduled: ${job_id}",
+                        mapping={"count": len(uids), "job_id": job_id})
+            return self.redirect(message=message)
+
+        transitioned = self.do_action(action, uids)
+        if not transitioned:
+            return self.redirect(message=_("No changes made."),
+                                 level="warning")
+        message = _("Changed items: ${count}",
+                    mapping={"count": len(transitioned)})
+        return self.success(transitioned, message=message)
+
+    def do_action(self, action, uids):
+        """Performs the transition to the objects with the UIDs passed in and
+        returns the UIDs of the objects that have been transitioned
+        """
+        return do_action_for_uids(action, uids)
+
+    def submit_action(self, action, uids):
+        """Schedules the transition of the objects with the UIDs passed in as
+        a background job and returns the job id
+        """
+        return submit("do_action", action=action, uids=uids)
+
+
+class WorkflowActionDeactivateCascadeAdapter(WorkflowActionBatchAdapter):
+    """Deactivates the selected antibiotic classes together with their
+    active antibiotics
+    """
+
+    def do_action(self, action, uids):
+        """Deactivates the antibiotic classes and their antibiotics
+        """
+        return deactivate_classes(uids)
+
+    def submit_action(self, action, uids):
+        """Schedules the deactivation of the antibiotic classes and their
+        antibiotics as a background job and returns the job id
+        """
+        return submit("deactivate_classes", uids=uids)
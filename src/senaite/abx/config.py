@@ -39,135 +39,165 @@ ANTIBIOTICS = [
     # Penicillins
     ("Penicillin", {
         "abbreviation": "P",
-        "antibiotic_class": _("Penicillins")
+        "antibiotic_class": _("Penicillins"),
+        "external_codes": ["WHONET:PEN"]
     }),
     ("Oxacillin", {
         "abbreviation": "Ox",
-        "antibiotic_class": _("Penicillins")
+        "antibiotic_class": _("Penicillins"),
+        "external_codes": ["WHONET:OXA"]
     }),
     ("Ampicillin", {
         "abbreviation": "Am",
-        "antibiotic_class": _("Penicillins")
+        "antibiotic_class": _("Penicillins"),
+        "external_codes": ["WHONET:AMP"]
     }),
     ("Ampicillin Sulbactam", {
         "abbreviation": "Ams",
-        "antibiotic_class": _("Penicillins")
+        "antibiotic_class": _("Penicillins"),
+        "external_codes": ["WHONET:SAM"]
     }),
     ("Piperacillin", {
         "abbreviation": "Pi",
-        "antibiotic_class": _("Penicillins")
+        "antibiotic_class": _("Penicillins"),
+        "external_codes": ["WHONET:PIP"]
     }),
 
     # Cephalosporins
     ("Cefazolin", {
         "abbreviation": "Cfz",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:CZO"]
     }),
     ("Ceftriaxone", {
         "abbreviation": "Cax",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:CRO"]
     }),
     ("Cefepime", {
         "abbreviation": "Pime",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:FEP"]
     }),
     ("Cefuroxime", {
         "abbreviation": "Cxm",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:CXM"]
     }),
     ("Cefotaxime", {
         "abbreviation": "Cft",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:CTX"]
     }),
     ("Ceftazidime", {
         "abbreviation": "Caz",
-        "antibiotic_class": _("Cephalosporins")
+        "antibiotic_class": _("Cephalosporins"),
+        "external_codes": ["WHONET:CAZ"]
     }),
 
     # Fluoroquinolones
     ("Ciprofloxacin", {
         "abbreviation": "Cp",
-        "antibiotic_class": _("Fluoroquinolones")
+        "antibiotic_class": _("Fluoroquinolones"),
+        "external_codes": ["WHONET:CIP"]
     }),
     ("Levofloxacin", {
         "abbreviation": "Levo",
-        "antibiotic_class": _("Fluoroquinolones")
+        "antibiotic_class": _("Fluoroquinolones"),
+        "external_codes": ["WHONET:LVX"]
     }),
     ("Moxifloxacin", {
         "abbreviation": "Mox",
-        "antibiotic_class": _("Fluoroquinolones")
+        "antibiotic_class": _("Fluoroquinolones"),
+        "external_codes": ["WHONET:MFX"]
     }),
 
     # Aminoglycosides
     ("Amikacin", {
         "abbreviation": "Amk",
-        "antibiotic_class": _("Aminoglycosides")
+        "antibiotic_class": _("Aminoglycosides"),
+        "external_codes": ["WHONET:AMK"]
     }),
     ("Gentamicin", {
         "abbreviation": "Gm",
-        "antibiotic_class": _("Aminoglycosides")
+        "antibiotic_class": _("Aminoglycosides"),
+        "external_codes": ["WHONET:GEN"]
     }),
     ("Tobramycin", {
         "abbreviation": "To",
-        "antibiotic_class": _("Aminoglycosides")
+        "antibiotic_class": _("Aminoglycosides"),
+        "external_codes": ["WHONET:TOB"]
     }),
 
     # Monobactams
     ("Aztreonam", {
         "abbreviation": "Azt",
-        "antibiotic_class": _("Monobactams")
+        "antibiotic_class": _("Monobactams"),
+        "external_codes": ["WHONET:ATM"]
     }),
     # Carbapenems
     ("Ertapenem", {
         "abbreviation": "Ert",
-        "antibiotic_class": _("Carbapenems")
+        "antibiotic_class": _("Carbapenems"),
+        "external_codes": ["WHONET:ETP"]
     }),
     ("Imienem", {
         "abbreviation": "Imp",
-        "antibiotic_class": _("Carbapenems")
+        "antibiotic_class": _("Carbapenems"),
+        "external_codes": ["WHONET:IPM"]
     }),
     ("Meropenem", {
         "abbreviation": "Mer",
-        "antibiotic_class": _("Carbapenems")
+        "antibiotic_class": _("Carbapenems"),
+        "external_codes": ["WHONET:MEM"]
     }),
 
     # Macrolides
     ("Azithromycin", {
         "abbreviation": "Azi",
-        "antibiotic_class": _("Macrolides")
+        "antibiotic_class": _("Macrolides"),
+        "external_codes": ["WHONET:AZM"]
     }),
     ("Clarithromycin", {
         "abbreviation": "Cla",
-        "antibiotic_class": _("Macrolides")
+        "antibiotic_class": _("Macrolides"),
+        "external_codes": ["WHONET:CLR"]
     }),
     ("Erythromycin", {
         "abbreviation": "E",
-        "antibiotic_class": _("Macrolides")
+        "antibiotic_class": _("Macrolides"),
+        "external_codes": ["WHONET:ERY"]
     }),
     ("Clindamycin", {
         "abbreviation": "Cdm",
-        "antibiotic_class": _("Macrolides")
+        "antibiotic_class": _("Macrolides"),
+        "external_codes": ["WHONET:CLI"]
     }),
 
     # Other
     ("Vancomycin", {
         "abbreviation": "Va",
-        "antibiotic_class": _("Other")
+        "antibiotic_class": _("Other"),
+        "external_codes": ["WHONET:VAN"]
     }),
     ("Rifampin", {
         "abbreviation": "Rif",
-        "antibiotic_class": _("Other")
+        "antibiotic_class": _("Other"),
+        "external_codes": ["WHONET:RIF"]
     }),
     ("Linezolid", {
         "abbreviation": "Lzd",
-        "antibiotic_class": _("Other")
+        "antibiotic_class": _("Other"),
+        "external_codes": ["WHONET:LNZ"]
     }),
     ("Tetracycline", {
         "abbreviation": "Te",
-        "antibiotic_class": _("Other")
+        "antibiotic_class": _("Other"),
+        "external_codes": ["WHONET:TCY"]
     }),
     ("Trimethoprim", {
         "abbreviation": "Ts",
-        "antibiotic_class": _("Other")
+        "antibiotic_class": _("Other"),
+        "external_codes": ["WHONET:TMP"]
     }),
 ]
@@ -22,9 +22,14 @@ from AccessControl import ClassSecurityInfo
 from bika.lims import api
 from plone.autoform import directives
 from plone.supermodel import model
+from plone.z3cform.textlines import TextLinesFieldWidget
 from Products.CMFCore import permissions
 from senaite.abx import messageFactory as _
+from senaite.abx.api import get_antibiotic_class
+from senaite.abx.api import parse_code
 from senaite.abx.interfaces import IAntibiotic
+from senaite.abx.uniqueness import get_uniqueness_lookup
+from senaite.abx.uniqueness import register_antibiotic
 from senaite.core.catalog import SETUP_CATALOG
 from senaite.core.content.base import Container
 from senaite.core.schema import UIDReferenceField
@@ -54,6 +59,18 @@ def validly(data, field_name):
     return True
 
 
+def get_conflicts(data, **values):
+    """Returns the conflicts of the values passed in with other antibiotics
+    from the uniqueness index
+    """
+    context = getattr(data, "__context__", None)
+    uid = None
+    if IAntibiotic.providedBy(context):
+        uid = api.get_uid(context)
+    index = get_uniqueness_lookup(context)
+    return index.get_conflicts(uid=uid, **values)
+
+
 class IAntibioticSchema(model.Schema):
     """Schema interface
     """
@@ -98,6 +115,18 @@ class IAntibioticSchema(model.Schema):
         catalog=SETUP_CATALOG
     )
 
+    external_codes = schema.List(
+        title=_(u"External codes"),
+        description=_(
+            u"Codes of this antibiotic in external coding systems, one per "
+            u"line, in the form SYSTEM:CODE (e.g. WHONET:CIP)"),
+        value_type=schema.TextLine(),
+        required=False,
+        default=[],
+    )
+
+    directives.widget("external_codes", TextLinesFieldWidget)
+
     @invariant
     def validate_title(data):
         """Checks if the title is unique
@@ -105,8 +134,7 @@ class IAntibioticSchema(model.Schema):
         if not validly(data, "title"):
             return
 
-        cat = api.get_tool(SETUP_CATALOG)
-        if cat(portal_type="Antibiotic", title=data.title):
+        if get_conflicts(data, title=data.title):
             raise Invalid(_("Title must be unique"))
 
     @invariant
@@ -116,11 +144,16 @@ class IAntibioticSchema(model.Schema):
         if not validly(data, "abbreviation"):
             return
 
-        cat = api.get_tool(SETUP_CATALOG)
-        for brain in cat(portal_type="Antibiotic"):
-            antibiotic = api.get_object(brain)
-            if antibiotic.abbreviation == data.abbreviation:
-                raise Invalid(_("Abbreviation must be unique"))
+        if get_conflicts(data, abbreviation=data.abbreviation):
+            raise Invalid(_("Abbreviation must be unique"))
+
+    @invariant
+    def validate_external_codes(data):
+        """Checks if the external codes are in the form SYSTEM:CODE
+        """
+        codes = getattr(data, "external_codes", None) or []
+        if not all(map(parse_code, codes)):
+            raise Invalid(_("External codes must be in the form SYSTEM:CODE"))
 
 
 @implementer(IAntibiotic, IAntibioticSchema)
@@ -146,20 +179,45 @@ class Antibiotic(Container):
         """
         mutator = self.mutator("abbreviation")
         mutator(self, value)
+        # update the uniqueness index, as no modified event is notified
+        register_antibiotic(self)
 
     @security.protected(permissions.View)
     def getAntibioticClass(self):
         """Returns the Antibiotic class this antibiotic is assigned to
         """
-        accessor = self.accessor("antibiotic_class")
-        return accessor(self)
+        # resolve the class through the request cache, so that consumers
+        # iterating over many antibiotics only look up each class once
+        uid = self.getRawAntibioticClass()
+        if not uid:
+            return None
+        return get_antibiotic_class(uid)
 
     @security.protected(permissions.View)
     def getRawAntibioticClass(self):
-        """Returns the UID of the antibiotic class
+        """Returns the UID of the antibiotic class or an empty string
         """
+        # never return None, so that antibiotics without class are indexed
         accessor = self.accessor("antibiotic_class", raw=True)
-        return accessor(self)
+        return accessor(self) or ""
+
+    @security.protected(permissions.View)
+    def getAntibioticClassTitle(self):
+        """Returns the title of the antibiotic class, if any
+        """
+        antibiotic_class = self.getAntibioticClass()
+        if not antibiotic_class:
+            return ""
+        return api.get_title(antibiotic_class)
+
+    @security.protected(permissions.View)
+    def getAntibioticClassPath(self):
+        """Returns the physical path of the antibiotic class, if any
+        """
+        antibiotic_class = self.getAntibioticClass()
+        if not antibiotic_class:
+            return ""
+        return api.get_path(antibiotic_class)
 
     @security.protected(permissions.ModifyPortalContent)
     def setAntibioticClass(self, value):
@@ -167,3 +225,18 @@ class Antibiotic(Container):
         """
         mutator = self.mutator("antibiotic_class")
         mutator(self, value)
+
+    @security.protected(permissions.View)
+    def getExternalCodes(self):
+        """Returns the external codes of this antibiotic, in the form
+        SYSTEM:CODE
+        """
+        accessor = self.accessor("external_codes")
+        return accessor(self) or []
+
+    @security.protected(permissions.ModifyPortalContent)
+    def setExternalCodes(self, value):
+        """Sets the external codes of this antibiotic
+        """
+        mutator = self.mutator("external_codes")
+        mutator(self, value)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from AccessControl import ClassSecurityInfo
+from plone.autoform import directives
+from plone.supermodel import model
+from Products.CMFCore import permissions
+from senaite.abx import messageFactory as _
+from senaite.abx.interfaces import IAntibioticPanel
+from senaite.core.catalog import SETUP_CATALOG
+from senaite.core.content.base import Container
+from senaite.core.schema import UIDReferenceField
+from senaite.core.z3cform.widgets.uidreference import UIDReferenceWidget
+from zope import schema
+from zope.interface import implementer
+
+
+class IAntibioticPanelSchema(model.Schema):
+    """Schema interface
+    """
+    title = schema.TextLine(
+        title=u"Title",
+        required=True,
+    )
+
+    description = schema.Text(
+        title=u"Description",
+        required=False,
+    )
+
+    antibiotics = UIDReferenceField(
+        title=_(u"Antibiotics"),
+        description=_(
+            u"Antibiotics of this panel, in the order they are applied"),
+        allowed_types=("Antibiotic", ),
+        multi_valued=True,
+        required=True,
+    )
+
+    directives.widget(
+        "antibiotics",
+        UIDReferenceWidget,
+        query={
+            "portal_type": "Antibiotic",
+            "is_active": True,
+            "sort_on": "sortable_title",
+            "sort_order": "ascending",
+        },
+        display_template="<a href='${url}'>${title}</a>",
+        columns=[
+            {
+                "name": "title",
+                "label": _(u"column_label_title", default=u"Title"),
+            }, {
+                "name": "getAbbreviation",
+                "label": _(u"column_label_abbreviation",
+                           default=u"Abbreviation"),
+            }
+        ],
+        catalog=SETUP_CATALOG
+    )
+
+
+@implementer(IAntibioticPanel, IAntibioticPanelSchema)
+class AntibioticPanel(Container):
+    """Antibiotic panel content
+    """
+    # Catalogs where this type will be catalogued
+    _catalogs = [SETUP_CATALOG]
+
+    security = ClassSecurityInfo()
+    exclude_from_nav = True
+
+    @security.protected(permissions.View)
+    def getAntibiotics(self):
+        """Returns the antibiotics of this panel, in order
+        """
+        accessor = self.accessor("antibiotics")
+        return accessor(self)
+
+    @security.protected(permissions.View)
+    def getRawAntibiotics(self):
+        """Returns the UIDs of the antibiotics of this panel, in order
+        """
+        accessor = self.accessor("antibiotics", raw=True)
+        return accessor(self) or []
+
+    @security.protected(permissions.ModifyPortalContent)
+    def setAntibiotics(self, value):
+        """Sets the antibiotics of this panel
+        """
+        mutator = self.mutator("antibiotics")
+        mutator(self, value)
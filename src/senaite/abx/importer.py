@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import csv
+import itertools
+import json
+import re
+
+import transaction
+from bika.lims import api
+from Products.CMFCore.indexing import processQueue
+from Products.CMFPlone.utils import safe_unicode
+from senaite.abx import logger
+from senaite.abx import messageFactory as _
+from senaite.abx.api import normalize
+from senaite.abx.api import parse_code
+from senaite.abx.uniqueness import get_uniqueness_lookup
+from senaite.core.catalog import SETUP_CATALOG
+
+# Number of antibiotics to create before indexing and committing
+DEFAULT_CHUNK_SIZE = 500
+
+# Statuses of the import report rows
+CREATED = "created"
+SKIPPED = "skipped"
+ERROR = "error"
+
+# Supported import formats
+FORMATS = ("csv", "json")
+
+
+def to_record(data):
+    """Returns a record dict with lower-cased keys and stripped unicode values
+    from the data dict passed in
+    """
+    record = {}
+    for key, value in data.items():
+        if not key:
+            continue
+        key = safe_unicode(key).strip().lower()
+        if isinstance(value, (list, tuple)):
+            # e.g. the external codes of a JSON export
+            value = u" ".join(map(safe_unicode, value))
+        record[key] = safe_unicode(value or u"").strip()
+    return record
+
+
+def parse_external_codes(value):
+    """Returns a tuple (codes, invalid) with the list of external codes in
+    the form SYSTEM:CODE from the whitespace, comma or semicolon separated
+    value passed in and the list of values that are not in that form
+    """
+    codes = []
+    invalid = []
+    for token in re.split(r"[\s,;]+", safe_unicode(value or u"")):
+        if not token:
+            continue
+        code = parse_code(token)
+        if code is None:
+            invalid.append(token)
+            continue
+        codes.append(u"{}:{}".format(*code))
+    return codes, invalid
+
+
+def read_csv(stream):
+    """Yields a record dict for each row of the CSV stream passed in. The
+    first row is expected to contain the column names
+    """
+    lines = iter(stream.readline, "")
+    for row in csv.DictReader(lines):
+        yield to_record(row)
+
+
+def read_json(stream):
+    """Yields a record dict for each object of the JSON stream passed in.
+    Both a JSON array of objects and JSON lines (one object per line) are
+    supported, but only the latter is read line by line
+    """
+    first = stream.readline()
+    if first.lstrip().startswith("["):
+        for obj in json.loads(first + stream.read()):
+            yield to_record(obj)
+        return
+
+    lines = itertools.chain([first], iter(stream.readline, ""))
+    for line in lines:
+        if line.strip():
+            yield to_record(json.loads(line))
+
+
+def read(stream, fmt="csv"):
+    """Yields the record dicts from the stream for the given format
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Format not supported: {}".format(fmt))
+    if fmt == "json":
+        return read_json(stream)
+    return read_csv(stream)
+
+
+def get_antibiotic_classes_map():
+    """Returns a dict of normalized title -> UID of all antibiotic classes
+    """
+    query = {"portal_type": "AntibioticClass"}
+    brains = api.search(query, SETUP_CATALOG)
+    return dict([(normalize(api.get_title(brain)), api.get_uid(brain))
+                 for brain in brains])
+
+
+def create_antibiotic(folder, title, abbreviation, antibiotic_class=None,
+                      description=None, external_codes=None):
+    """Creates an antibiotic inside the folder passed in.
+
+    The title and abbreviation are claimed in the uniqueness index of the
+    folder. The object is reindexed once all its values are set. The indexing
+    operations are queued and processed together with the rest of the queue
+    """
+    obj = api.create(folder, "Antibiotic", title=title)
+    obj.setAbbreviation(abbreviation)
+    if antibiotic_class:
+        obj.setAntibioticClass(antibiotic_class)
+    if description:
+        obj.setDescription(description)
+    if external_codes:
+        obj.setExternalCodes(external_codes)
+    obj.reindexObject()
+    return obj
+
+
+def flush(commit=False):
+    """Processes the indexing queue and either commits the transaction or
+    sets a savepoint, so that the memory used by the ZODB cache is released
+    """
+    processQueue()
+    if commit:
+        transaction.commit()
+    else:
+        transaction.savepoint(optimistic=True)
+    api.get_portal()._p_jar.cacheGC()
+
+
+def import_antibiotics(folder, records, chunk_size=DEFAULT_CHUNK_SIZE,
+                       commit=False):
+    """Creates antibiotics in the folder for the records passed in.
+
+    Records are dicts with the keys "title", "abbreviation",
+    "antibiotic_class" (title of the class), "description" and
+    "external_codes" (SYSTEM:CODE values separated by whitespaces, commas or
+    semicolons). Records can be a generator, so that the input is consumed
+    as a stream.
+
+    Antibiotics whose title or abbreviation already exist are skipped. The
+    indexing queue is processed every chunk_size created antibiotics and the
+    transaction committed if commit is True.
+
+    Returns a list of dicts, one per record, with the keys "row", "title",
+    "status", "uid" and "message"
+    """
+    chunk_size = max(api.to_int(chunk_size, DEFAULT_CHUNK_SIZE), 1)
+    classes = get_antibiotic_classes_map()
+
+    # created antibiotics are claimed in the uniqueness index, so duplicates
+    # within the records are detected as well
+    index = get_uniqueness_lookup(folder)
+
+    report = []
+    created = 0
+    for num, record in enumerate(records, start=1):
+        title = record.get("title")
+        abbreviation = record.get("abbreviation")
+        class_title = record.get("antibiotic_class")
+        item = {
+            "row": num,
+            "title": title,
+            "status": ERROR,
+            "uid": None,
+            "message": "",
+        }
+        report.append(item)
+
+        if not title or not abbreviation:
+            item["message"] = _("Title and abbreviation are required")
+            continue
+
+        conflicts = index.get_conflicts(title=title,
+                                        abbreviation=abbreviation)
+        if "title" in conflicts:
+            item["status"] = SKIPPED
+            item["message"] = _("Title already exists")
+            continue
+        if "abbreviation" in conflicts:
+            item["status"] = SKIPPED
+            item["message"] = _("Abbreviation already exists")
+            continue
+
+        codes, invalid = parse_external_codes(record.get("external_codes"))
+        if invalid:
+            item["message"] = _(
+                "Invalid external codes: ${codes}",
+                mapping={"codes": u", ".join(invalid)})
+            continue
+
+        class_uid = None
+        if class_title:
+            class_uid = classes.get(normalize(class_title))
+            if not class_uid:
+                item["message"] = _(
+                    "Antibiotic class not found: ${title}",
+                    mapping={"title": class_title})
+                continue
+
+        obj = create_antibiotic(folder, title, abbreviation,
+                                antibiotic_class=class_uid,
+                                description=record.get("description"),
+                                external_codes=codes)
+        item["status"] = CREATED
+        item["uid"] = api.get_uid(obj)
+        index.register(item["uid"], title, abbreviation)
+
+        created += 1
+        if created % chunk_size == 0:
+            logger.info("Imported {} antibiotics ...".format(created))
+            flush(commit=commit)
+
+    flush(commit=commit)
+    logger.info("Imported {} antibiotics [DONE]".format(created))
+    return report
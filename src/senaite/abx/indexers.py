@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from plone.indexer import indexer
+from senaite.abx.api import get_code_key
+from senaite.abx.api import normalize
+from senaite.abx.api import parse_code
+from senaite.abx.interfaces import IAntibiotic
+from senaite.core.interfaces import ISetupCatalog
+
+
+@indexer(IAntibiotic, ISetupCatalog)
+def abbreviation(instance):
+    """Returns the normalized abbreviation of the antibiotic
+    """
+    return normalize(instance.getAbbreviation())
+
+
+@indexer(IAntibiotic, ISetupCatalog)
+def external_codes(instance):
+    """Returns the normalized keys of the external codes of the antibiotic
+    """
+    codes = filter(None, map(parse_code, instance.getExternalCodes()))
+    return [get_code_key(system, code) for system, code in codes]
+
+
+@indexer(IAntibiotic, ISetupCatalog)
+def sortable_class_title(instance):
+    """Returns the normalized title of the antibiotic class of the antibiotic
+    """
+    return normalize(instance.getAntibioticClassTitle())
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import contextlib
+import functools
+import threading
+import time
+
+from bika.lims import api
+from senaite.abx import logger
+from senaite.core.catalog import SETUP_CATALOG
+from senaite.core.catalog import SetupCatalog
+
+# Request key (form parameter or cookie) that enables the instrumentation
+DEBUG_FLAG = "abx_debug"
+
+# Catalog methods that are counted as queries
+CATALOG_METHODS = ("searchResults", "__call__", "unrestrictedSearchResults")
+
+_local = threading.local()
+_lock = threading.Lock()
+
+# Search methods of the setup catalog class replaced by hook_catalog
+_originals = {}
+
+
+class Stats(object):
+    """Counters collected while instrumenting
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.loads = 0
+        self.folderitems = 0
+        self.folderitem_time = 0.0
+        self.time = 0.0
+
+    def to_dict(self):
+        """Returns the counters as a dict
+        """
+        return {
+            "queries": self.queries,
+            "loads": self.loads,
+            "folderitems": self.folderitems,
+            "folderitem_time": self.folderitem_time,
+            "time": self.time,
+        }
+
+
+def get_stats():
+    """Returns the stats being collected in the current thread or None
+    """
+    return getattr(_local, "stats", None)
+
+
+def count_queries(func):
+    """Wraps a catalog search method to count the queries against the setup
+    catalog while the instrumentation is active
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        stats = get_stats()
+        if stats is not None:
+            stats.queries += 1
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def is_catalog_hooked():
+    """Returns whether the queries against the setup catalog are counted
+    """
+    return bool(_originals)
+
+
+def hook_catalog():
+    """Wraps the search methods of the setup catalog class, so that queries
+    are counted in every connection. The class is shared by the whole
+    process, so this is meant to be called by test layers only and undone
+    with unhook_catalog
+    """
+    with _lock:
+        if _originals:
+            return
+        for name in CATALOG_METHODS:
+            method = getattr(SetupCatalog, name, None)
+            if method is None:
+                continue
+            _originals[name] = SetupCatalog.__dict__.get(name)
+            func = getattr(method, "__func__", method)
+            setattr(SetupCatalog, name, count_queries(func))
+
+
+def unhook_catalog():
+    """Restores the search methods of the setup catalog class
+    """
+    with _lock:
+        for name, method in _originals.items():
+            if method is None:
+                # the method was inherited
+                delattr(SetupCatalog, name)
+            else:
+                setattr(SetupCatalog, name, method)
+        _originals.clear()
+
+
+@contextlib.contextmanager
+def counting_queries(catalog):
+    """Counts the searches of the given catalog tool while the context is
+    active.
+
+    The search method of the internal catalog, which is called by
+    searchResults, __call__ and unrestrictedSearchResults, is wrapped on the
+    instance loaded by the connection of the current thread only. The wrapper
+    is set in the instance dict, so that the persistent object is not marked
+    as changed, and removed when the context exits
+    """
+    internal = catalog._catalog
+    # load the state first, so that it does not replace the wrapper
+    internal._p_activate()
+    state = internal.__dict__
+    if "search" in state:
+        # the searches are already counted by an outer context
+        yield
+        return
+    state["search"] = count_queries(type(internal).search).__get__(internal)
+    try:
+        yield
+    finally:
+        state.pop("search", None)
+
+
+@contextlib.contextmanager
+def instrument():
+    """Collects the number of queries against the setup catalog, the number
+    of objects loaded by the ZODB connection and the time spent in
+    folderitem while the context is active. Yields the Stats object
+    """
+    portal = api.get_portal()
+    jar = portal._p_jar
+    stats = Stats()
+    previous = get_stats()
+    _local.stats = stats
+    loads = jar.getTransferCounts()[0]
+    start = time.time()
+    try:
+        if is_catalog_hooked():
+            # the searches are counted by the class of the setup catalog
+            yield stats
+        else:
+            catalog = api.get_tool(SETUP_CATALOG, context=portal)
+            with counting_queries(catalog):
+                yield stats
+    finally:
+        stats.time = time.time() - start
+        stats.loads = jar.getTransferCounts()[0] - loads
+        _local.stats = previous
+
+
+def is_enabled(request):
+    """Returns whether the instrumentation is enabled for the request
+    """
+    return bool(request.get(DEBUG_FLAG))
+
+
+def report(request, stats, name):
+    """Writes the stats to the response headers and the log
+    """
+    values = stats.to_dict()
+    response = request.response
+    response.setHeader("X-ABX-Catalog-Queries", str(stats.queries))
+    response.setHeader("X-ABX-ZODB-Loads", str(stats.loads))
+    response.setHeader("X-ABX-Folderitems", str(stats.folderitems))
+    response.setHeader("X-ABX-Folderitem-Time",
+                       "{:.6f}".format(stats.folderitem_time))
+    logger.info("{}: {queries} catalog queries, {loads} ZODB loads, "
+                "{folderitems} folderitems in {folderitem_time:.3f}s, "
+                "total {time:.3f}s".format(name, **values))
+
+
+def instrumented(func):
+    """Decorator for view methods that collects and reports the stats when
+    the debug flag is set in the request
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        # nested instrumented calls are reported by the outermost one
+        if get_stats() is not None or not is_enabled(self.request):
+            return func(self, *args, **kwargs)
+        with instrument() as stats:
+            result = func(self, *args, **kwargs)
+        name = "{}.{}".format(self.__class__.__name__, func.__name__)
+        report(self.request, stats, name)
+        return result
+    return wrapper
+
+
+def timed_folderitem(func):
+    """Decorator for folderitem that accounts the time spent in the method
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats = get_stats()
+        if stats is None:
+            return func(*args, **kwargs)
+        start = time.time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.folderitems += 1
+            stats.folderitem_time += time.time() - start
+    return wrapper
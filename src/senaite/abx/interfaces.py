@@ -50,3 +50,48 @@ class IAntibioticClassFolder(IHideActionsMenu, IDoNotSupportSnapshots):
 class IAntibioticFolder(IHideActionsMenu, IDoNotSupportSnapshots):
     """Marker interface for AntibioticFolder content
     """
+
+
+class IAntibioticPanel(Interface):
+    """Marker interface for AntibioticPanel content
+    """
+
+
+class IAntibioticPanelFolder(IHideActionsMenu, IDoNotSupportSnapshots):
+    """Marker interface for AntibioticPanelFolder content
+    """
+
+
+class IAntibioticRegistry(Interface):
+    """In-memory registry of antibiotics
+    """
+
+    def get_record(uid):
+        """Returns the antibiotic record for the UID passed in or None
+        """
+
+    def get_uid_by_title(title):
+        """Returns the UID of the antibiotic with the title passed in
+        """
+
+    def get_uid_by_abbreviation(abbreviation):
+        """Returns the UID of the antibiotic with the abbreviation passed in
+        """
+
+    def get_records():
+        """Returns all antibiotic records
+        """
+
+    def get_class_records():
+        """Returns all antibiotic class records
+        """
+
+    def resolve_codes(system, codes):
+        """Resolves the codes from the coding system passed in to antibiotic
+        UIDs. Returns a tuple (resolved, unknown)
+        """
+
+    def search(term, limit=10, active_only=True):
+        """Returns the antibiotic records whose abbreviation or title start
+        with the term passed in
+        """
@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import itertools
+import threading
+import time
+import traceback
+import uuid
+
+import transaction
+from AccessControl.SecurityManagement import newSecurityManager
+from AccessControl.SecurityManagement import noSecurityManager
+from BTrees.OOBTree import OOBTree
+from bika.lims import api
+from persistent.mapping import PersistentMapping
+from Products.CMFCore.indexing import processQueue
+from Products.CMFPlone.utils import safe_unicode
+from senaite.abx import logger
+from senaite.abx.importer import CREATED
+from senaite.abx.importer import DEFAULT_CHUNK_SIZE
+from senaite.abx.importer import SKIPPED
+from senaite.abx.importer import import_antibiotics
+from senaite.abx.importer import read
+from senaite.abx.reassign import reassign_antibiotics
+from senaite.abx.workflow import deactivate_classes
+from senaite.abx.workflow import do_action_for_uids
+from senaite.core.catalog import SETUP_CATALOG
+from Testing.makerequest import makerequest
+from ZODB.POSException import ConflictError
+from zope.annotation.interfaces import IAnnotations
+from zope.component.hooks import setSite
+
+# Portal annotation key of the persistent job queue
+ANNOTATION_KEY = "senaite.abx.jobs"
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Number of finished jobs to keep
+MAX_FINISHED_JOBS = 50
+
+# Seconds without progress after which a running job is considered to be
+# interrupted, e.g. because its process was stopped
+JOB_TIMEOUT = 900
+
+# Job name -> function(portal, job, **params)
+JOBS = {}
+
+# Portal path -> running worker of this process
+_workers = {}
+_lock = threading.Lock()
+
+
+def job(name):
+    """Decorator that registers the function as the job with the given name.
+    The function is called with the portal, the job record and the params
+    the job was submitted with
+    """
+    def decorator(func):
+        JOBS[name] = func
+        return func
+    return decorator
+
+
+def get_jobs_storage(portal=None, create=False):
+    """Returns the persistent mapping of job id -> job record or None if no
+    job was submitted yet and create is False
+    """
+    portal = portal or api.get_portal()
+    annotations = IAnnotations(portal)
+    storage = annotations.get(ANNOTATION_KEY)
+    if storage is None and create:
+        storage = annotations[ANNOTATION_KEY] = OOBTree()
+    return storage
+
+
+def get_job(job_id, portal=None):
+    """Returns the job record with the id passed in or None
+    """
+    storage = get_jobs_storage(portal)
+    if storage is None:
+        return None
+    return storage.get(job_id)
+
+
+def get_latest_jobs(limit, portal=None):
+    """Returns the latest job records, newest first
+    """
+    storage = get_jobs_storage(portal)
+    if storage is None:
+        return []
+    records = storage.values()[-limit:]
+    return list(reversed(records))
+
+
+def get_job_info(job):
+    """Returns the JSON-serializable representation of the job record
+    """
+    return {
+        "id": job["id"],
+        "name": job["name"],
+        "status": job["status"],
+        "creator": job["creator"],
+        "created": job["created"],
+        "started": job["started"],
+        "finished": job["finished"],
+        "done": job["done"],
+        "total": job["total"],
+        "message": job["message"],
+        "result": job["result"],
+    }
+
+
+def submit(name, **params):
+    """Adds a job to the queue and returns its id. The job, together with
+    any other queued job, is run by the worker of this process once the
+    current transaction is committed
+    """
+    if name not in JOBS:
+        raise ValueError("Unknown job: {}".format(name))
+
+    portal = api.get_portal()
+    storage = get_jobs_storage(portal, create=True)
+    prune(storage)
+
+    # ids are sortable by creation time
+    job_id = "{:.6f}-{}".format(time.time(), uuid.uuid4().hex[:8])
+    record = PersistentMapping()
+    record.update({
+        "id": job_id,
+        "name": name,
+        "params": params,
+        "status": QUEUED,
+        "creator": api.get_current_user().getId(),
+        "created": time.time(),
+        "started": None,
+        "updated": None,
+        "finished": None,
+        "done": 0,
+        "total": 0,
+        "message": "",
+        "result": None,
+    })
+    storage[job_id] = record
+
+    db = portal._p_jar.db()
+    path = api.get_path(portal)
+    transaction.get().addAfterCommitHook(
+        lambda success: success and start_worker(db, path))
+    return job_id
+
+
+def prune(storage):
+    """Removes the oldest finished jobs, so that MAX_FINISHED_JOBS are kept
+    """
+    finished = [job_id for job_id, record in storage.items()
+                if record["status"] in (DONE, FAILED)]
+    for job_id in finished[:-MAX_FINISHED_JOBS]:
+        del storage[job_id]
+
+
+def update_progress(record, done, total=None, message=None):
+    """Updates the progress of the running job and commits the transaction,
+    so that the progress can be polled and the work done is kept
+    """
+    record["done"] = done
+    record["updated"] = time.time()
+    if total is not None:
+        record["total"] = total
+    if message is not None:
+        record["message"] = message
+    transaction.commit()
+
+
+def recover_jobs(storage, timeout=JOB_TIMEOUT):
+    """Marks the running jobs that did not report progress within the
+    timeout as failed and returns their ids
+    """
+    now = time.time()
+    recovered = []
+    for job_id, record in storage.items():
+        if record["status"] != RUNNING:
+            continue
+        updated = record.get("updated") or record["started"]
+        if now - updated < timeout:
+            continue
+        logger.warn("Job {} ({}) was interrupted".format(
+            record["name"], job_id))
+        record["status"] = FAILED
+        record["finished"] = now
+        record["message"] = u"Interrupted"
+        recovered.append(job_id)
+    return recovered
+
+
+def start_workers(db):
+    """Starts the workers of this process for the portals with queued or
+    running jobs, so that jobs left by a stopped process are resumed or
+    recovered
+    """
+    paths = []
+    connection = db.open()
+    try:
+        app = connection.root()["Application"]
+        for portal in app.objectValues("Plone Site"):
+            storage = get_jobs_storage(portal) or {}
+            statuses = [record["status"] for record in storage.values()]
+            if QUEUED in statuses or RUNNING in statuses:
+                paths.append(api.get_path(portal))
+    finally:
+        transaction.abort()
+        connection.close()
+    for path in paths:
+        start_worker(db, path)
+
+
+def on_database_opened(event):
+    """Starts the workers for the jobs left by the previous run of the
+    process
+    """
+    start_workers(event.database)
+
+
+def start_worker(db, portal_path):
+    """Starts the worker of this process for the portal, unless it is
+    running already. A running worker is told to look for new jobs
+    """
+    with _lock:
+        worker = _workers.get(portal_path)
+        if worker is not None and worker.is_alive():
+            worker.pending = True
+            return worker
+        worker = _workers[portal_path] = Worker(db, portal_path)
+        worker.start()
+        return worker
+
+
+class Worker(threading.Thread):
+    """Runs the queued jobs one by one with its own ZODB connection, and
+    stops once there are no queued jobs left
+    """
+
+    def __init__(self, db, portal_path):
+        super(Worker, self).__init__(name="senaite.abx.jobs")
+        self.daemon = True
+        self.db = db
+        self.portal_path = portal_path
+        self.pending = False
+
+    def run(self):
+        connection = self.db.open()
+        try:
+            app = makerequest(connection.root()["Application"])
+            portal = app.unrestrictedTraverse(self.portal_path)
+            setSite(portal)
+            self.recover(portal)
+            while True:
+                job_id = self.claim(portal)
+                if job_id:
+                    self.execute(portal, job_id)
+                    continue
+                with _lock:
+                    if not self.pending:
+                        _workers.pop(self.portal_path, None)
+                        break
+                    self.pending = False
+        except Exception:
+            logger.error("Job worker failed: {}".format(
+                traceback.format_exc()))
+            with _lock:
+                _workers.pop(self.portal_path, None)
+        finally:
+            transaction.abort()
+            noSecurityManager()
+            setSite(None)
+            connection.close()
+
+    def recover(self, portal):
+        """Marks the running jobs that did not report progress within
+        JOB_TIMEOUT as failed
+        """
+        transaction.abort()
+        storage = get_jobs_storage(portal) or {}
+        if not recover_jobs(storage):
+            return
+        try:
+            transaction.commit()
+        except ConflictError:
+            # recovered by the worker of another ZEO client
+            transaction.abort()
+
+    def claim(self, portal):
+        """Marks the oldest queued job as running and returns its id. Jobs
+        claimed concurrently by another ZEO client are skipped
+        """
+        while True:
+            # see the changes committed by other connections
+            transaction.abort()
+            storage = get_jobs_storage(portal) or {}
+            queued = [job_id for job_id, record in storage.items()
+                      if record["status"] == QUEUED]
+            if not queued:
+                return None
+            record = storage[queued[0]]
+            record["status"] = RUNNING
+            record["started"] = record["updated"] = time.time()
+            try:
+                transaction.commit()
+                return record["id"]
+            except ConflictError:
+                logger.info("Job {} claimed by another worker".format(
+                    queued[0]))
+
+    def execute(self, portal, job_id):
+        """Runs the job as the user that submitted it
+        """
+        record = get_job(job_id, portal)
+        name = record["name"]
+        logger.info("Running job {} ({}) ...".format(name, job_id))
+        try:
+            self.login(portal, record["creator"])
+            func = JOBS[name]
+            record["result"] = func(portal, record, **record["params"])
+            record["status"] = DONE
+            record["finished"] = time.time()
+            transaction.commit()
+            logger.info("Running job {} ({}) [DONE]".format(name, job_id))
+        except Exception as e:
+            transaction.abort()
+            logger.error("Job {} ({}) failed: {}".format(
+                name, job_id, traceback.format_exc()))
+            record = get_job(job_id, portal)
+            record["status"] = FAILED
+            record["finished"] = time.time()
+            record["message"] = safe_unicode(repr(e))
+            transaction.commit()
+        finally:
+            noSecurityManager()
+
+    def login(self, portal, userid):
+        """Sets the security context of the user with the id passed in
+        """
+        root = portal.getPhysicalRoot()
+        for acl_users in (portal.acl_users, root.acl_users):
+            user = acl_users.getUserById(userid)
+            if user is not None:
+                newSecurityManager(None, user.__of__(acl_users))
+                return
+        raise ValueError("User not found: {}".format(userid))
+
+
+@job("import_antibiotics")
+def import_antibiotics_job(portal, record, folder, upload, fmt="csv",
+                           chunk_size=DEFAULT_CHUNK_SIZE):
+    """Imports the antibiotic records of the uploaded file, stored as a blob,
+    into the folder with the path passed in, committing after each chunk.
+    The file is read as a stream, so the records are never held in memory
+    """
+    folder = portal.unrestrictedTraverse(folder)
+    chunk_size = max(api.to_int(chunk_size, DEFAULT_CHUNK_SIZE), 1)
+
+    # count the records first, so that the progress can be reported
+    with upload.open("c") as stream:
+        total = sum(1 for item in read(stream, fmt=fmt))
+    update_progress(record, 0, total=total)
+
+    counts = {CREATED: 0, SKIPPED: 0}
+    errors = []
+    done = 0
+    with upload.open("c") as stream:
+        records = read(stream, fmt=fmt)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                break
+            report = import_antibiotics(folder, chunk, chunk_size=chunk_size,
+                                        commit=False)
+            for item in report:
+                if item["status"] in counts:
+                    counts[item["status"]] += 1
+                    continue
+                errors.append({
+                    "row": done + item["row"],
+                    "title": item["title"],
+                    "message": safe_unicode(item["message"]),
+                })
+            processQueue()
+            done += len(chunk)
+            update_progress(record, done)
+
+    # only the report is kept, the uploaded file is not needed anymore
+    record["params"] = dict(record["params"], upload=None)
+    return {
+        "created": counts[CREATED],
+        "skipped": counts[SKIPPED],
+        "errors": errors,
+    }
+
+
+@job("reindex")
+def reindex_job(portal, record, portal_types=None,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """Reindexes the objects of the senaite.abx types, committing after each
+    chunk
+    """
+    portal_types = portal_types or [
+        "Antibiotic", "AntibioticClass", "AntibioticPanel"]
+    catalog = api.get_tool(SETUP_CATALOG, context=portal)
+    brains = catalog.unrestrictedSearchResults(portal_type=portal_types)
+    uids = map(api.get_uid, brains)
+    total = len(uids)
+    update_progress(record, 0, total=total)
+
+    for start in range(0, total, chunk_size):
+        chunk = uids[start:start + chunk_size]
+        for brain in catalog.unrestrictedSearchResults(UID=chunk):
+            brain._unrestrictedGetObject().reindexObject()
+        processQueue()
+        update_progress(record, start + len(chunk))
+        portal._p_jar.cacheGC()
+    return {"reindexed": total}
+
+
+@job("reassign_antibiotics")
+def reassign_antibiotics_job(portal, record, target, source=None, uids=None,
+                             deactivate_source=False,
+                             chunk_size=DEFAULT_CHUNK_SIZE):
+    """Assigns the antibiotics, or all antibiotics of the source class, to
+    the target class, committing after each chunk
+    """
+    def progress(done, total):
+        update_progress(record, done, total=total)
+
+    reassigned = reassign_antibiotics(
+        target, source=source, uids=uids,
+        deactivate_source=deactivate_source, chunk_size=chunk_size,
+        commit=True, progress=progress)
+    return {"reassigned": reassigned}
+
+
+@job("do_action")
+def do_action_job(portal, record, action, uids):
+    """Performs the transition to the objects with the UIDs passed in,
+    committing after each batch
+    """
+    def progress(done, total):
+        update_progress(record, done, total=total)
+
+    transitioned = do_action_for_uids(action, uids, commit=True,
+                                      progress=progress)
+    return {"transitioned": len(transitioned)}
+
+
+@job("deactivate_classes")
+def deactivate_classes_job(portal, record, uids):
+    """Deactivates the antibiotic classes with the UIDs passed in together
+    with their active antibiotics, committing after each batch
+    """
+    def progress(done, total):
+        update_progress(record, done, total=total)
+
+    deactivated = deactivate_classes(uids, commit=True, progress=progress)
+    return {"deactivated": len(deactivated)}
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from bika.lims.workflow import doActionFor as do_action_for
+from senaite.abx import logger
+from senaite.abx.api import get_antibiotic_class
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.importer import DEFAULT_CHUNK_SIZE
+from senaite.abx.importer import flush
+from senaite.abx.registry import invalidate
+from senaite.abx.subscribers import DEPENDENT_INDEXES
+from senaite.core.catalog import SETUP_CATALOG
+
+REASSIGN_INDEXES = ["getRawAntibioticClass"] + DEPENDENT_INDEXES
+
+
+def reassign_antibiotics(target, source=None, uids=None,
+                         deactivate_source=False,
+                         chunk_size=DEFAULT_CHUNK_SIZE, commit=False,
+                         progress=None):
+    """Assigns the antibiotics with the UIDs passed in, or all antibiotics of
+    the source class, to the target class.
+
+    Antibiotics are processed in chunks: the class is set to all antibiotics
+    of the chunk first and then each one is reindexed once and only for the
+    class-dependent indexes and metadata. The indexing queue is
+    processed after each chunk and the transaction committed if commit is
+    True. If deactivate_source is True, the source class is deactivated once
+    it has no antibiotics left. The function progress, if any, is called
+    with the number of antibiotics processed and the total after each chunk.
+
+    Returns the number of antibiotics reassigned
+    """
+    target = api.get_uid(target) if api.is_object(target) else target
+    if not get_antibiotic_class(target):
+        raise ValueError("Antibiotic class not found: {}".format(target))
+
+    source = api.get_uid(source) if api.is_object(source) else source
+    if source == target:
+        raise ValueError("Source and target classes are the same")
+
+    if uids is None:
+        if not source:
+            raise ValueError("Either a source class or UIDs are required")
+        brains = get_antibiotics_for_class(source, active_only=False)
+        uids = map(api.get_uid, brains)
+
+    chunk_size = max(api.to_int(chunk_size, DEFAULT_CHUNK_SIZE), 1)
+    total = len(uids)
+    reassigned = 0
+    for start in range(0, total, chunk_size):
+        chunk = uids[start:start + chunk_size]
+        query = {"portal_type": "Antibiotic", "UID": chunk}
+        brains = api.search(query, SETUP_CATALOG)
+        brains = filter(lambda b: b.getRawAntibioticClass != target, brains)
+        objs = map(api.get_object, brains)
+        for obj in objs:
+            obj.setAntibioticClass(target)
+        for obj in objs:
+            obj.reindexObject(idxs=REASSIGN_INDEXES)
+        reassigned += len(objs)
+        flush(commit=commit)
+        logger.info("Reassigned antibiotics: {}/{}".format(
+            start + len(chunk), total))
+        if progress:
+            progress(start + len(chunk), total)
+
+    # no modified events are notified for the antibiotics
+    invalidate()
+
+    if source and deactivate_source:
+        remaining = get_antibiotics_for_class(source, active_only=False)
+        source_class = get_antibiotic_class(source)
+        if not remaining and api.is_active(source_class):
+            do_action_for(source_class, "deactivate")
+
+    return reassigned
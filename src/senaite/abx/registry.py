@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import bisect
+import collections
+import threading
+
+from BTrees.Length import Length
+from bika.lims import api
+from Products.CMFPlone.utils import safe_unicode
+from senaite.abx import logger
+from senaite.abx.api import get_code_key
+from senaite.abx.api import get_request_cache
+from senaite.abx.api import normalize
+from senaite.abx.api import parse_code
+from senaite.abx.interfaces import IAntibioticRegistry
+from senaite.core.catalog import SETUP_CATALOG
+from zope.annotation.interfaces import IAnnotations
+from zope.component import getUtility
+from zope.interface import implementer
+
+# Portal annotation key of the persistent invalidation counter
+COUNTER_KEY = "senaite.abx.registry.counter"
+
+# Request annotation key of the snapshots built with uncommitted changes
+UNCOMMITTED_CACHE_KEY = "senaite.abx.registry.uncommitted"
+
+# Immutable record of an antibiotic
+AntibioticRecord = collections.namedtuple(
+    "AntibioticRecord",
+    ["uid", "title", "abbreviation", "class_uid", "is_active", "codes"])
+
+# Immutable record of an antibiotic class
+AntibioticClassRecord = collections.namedtuple(
+    "AntibioticClassRecord", ["uid", "title", "is_active"])
+
+
+class Snapshot(object):
+    """Lookup tables of the antibiotics built at a given counter value.
+
+    The tables are never modified once built. A new snapshot is built instead
+    """
+
+    def __init__(self, counter, records, classes=()):
+        self.counter = counter
+        # values derived from the snapshot, e.g. vocabularies
+        self.cache = {}
+        self._classes = dict([(record.uid, record) for record in classes])
+        self._by_uid = {}
+        self._by_title = {}
+        self._by_abbreviation = {}
+        self._by_code = {}
+        # sorted lists of (normalized key, uid) for prefix searches
+        self._titles = []
+        self._abbreviations = []
+        for record in records:
+            title = normalize(record.title)
+            abbreviation = normalize(record.abbreviation)
+            self._by_uid[record.uid] = record
+            self._by_title.setdefault(title, record.uid)
+            self._by_abbreviation.setdefault(abbreviation, record.uid)
+            self._titles.append((title, record.uid))
+            for code in filter(None, map(parse_code, record.codes)):
+                self._by_code.setdefault(get_code_key(*code), record.uid)
+            if abbreviation:
+                self._abbreviations.append((abbreviation, record.uid))
+        self._titles.sort()
+        self._abbreviations.sort()
+
+    def get_record(self, uid):
+        """Returns the record for the UID passed in or None
+        """
+        return self._by_uid.get(uid)
+
+    def get_uid_by_title(self, title):
+        """Returns the UID for the title passed in or None
+        """
+        return self._by_title.get(normalize(title))
+
+    def get_uid_by_abbreviation(self, abbreviation):
+        """Returns the UID for the abbreviation passed in or None
+        """
+        return self._by_abbreviation.get(normalize(abbreviation))
+
+    def records(self):
+        """Returns a tuple with all records
+        """
+        return tuple(self._by_uid.values())
+
+    def resolve_codes(self, system, codes):
+        """Returns a tuple (resolved, unknown), where resolved is a dict of
+        code -> UID and unknown is the list of codes without antibiotic
+        """
+        resolved = {}
+        unknown = []
+        for code in codes:
+            uid = self._by_code.get(get_code_key(system, code))
+            if uid:
+                resolved[code] = uid
+            else:
+                unknown.append(code)
+        return resolved, unknown
+
+    def get_class_record(self, uid):
+        """Returns the antibiotic class record for the UID passed in or None
+        """
+        return self._classes.get(uid)
+
+    def class_records(self):
+        """Returns a tuple with all antibiotic class records
+        """
+        return tuple(self._classes.values())
+
+    def search(self, term, limit=10, active_only=True):
+        """Returns a tuple with up to limit records whose abbreviation or
+        title start with the term passed in. Abbreviation matches come first
+        """
+        term = normalize(term)
+        if not term:
+            return ()
+        found = []
+        seen = set()
+        for keys in (self._abbreviations, self._titles):
+            pos = bisect.bisect_left(keys, (term, ""))
+            while pos < len(keys) and len(found) < limit:
+                key, uid = keys[pos]
+                if not key.startswith(term):
+                    break
+                pos += 1
+                record = self._by_uid[uid]
+                if uid in seen or (active_only and not record.is_active):
+                    continue
+                seen.add(uid)
+                found.append(record)
+        return tuple(found)
+
+
+def get_counter(portal=None, create=False):
+    """Returns the persistent invalidation counter of the registry or None
+    if it does not exist yet and create is False
+    """
+    portal = portal or api.get_portal()
+    annotations = IAnnotations(portal)
+    counter = annotations.get(COUNTER_KEY)
+    if counter is None and create:
+        counter = annotations[COUNTER_KEY] = Length()
+    return counter
+
+
+def invalidate(portal=None):
+    """Invalidates the registry of all ZEO clients by increasing the
+    persistent counter. Conflicts on the counter are resolved by the ZODB
+    """
+    get_counter(portal, create=True).change(1)
+
+
+def get_registry():
+    """Returns the antibiotic registry utility
+    """
+    return getUtility(IAntibioticRegistry)
+
+
+@implementer(IAntibioticRegistry)
+class AntibioticRegistry(object):
+    """In-memory registry of antibiotics.
+
+    The lookup tables are built lazily from catalog metadata and kept per
+    portal and process until the persistent counter changes
+    """
+
+    def __init__(self):
+        self._snapshots = {}
+        # portal path -> lock held while its snapshot is built
+        self._build_locks = collections.defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def get_snapshot(self):
+        """Returns the up-to-date snapshot for the current portal
+        """
+        portal = api.get_portal()
+        key = api.get_path(portal)
+        counter = get_counter(portal)
+        value = counter() if counter is not None else 0
+
+        # do not share a snapshot built while the counter is being changed
+        # by the current (not yet committed) transaction, but keep it for the
+        # rest of the request
+        uncommitted = counter is not None and (
+            counter._p_jar is None or counter._p_changed)
+        if uncommitted:
+            cache = get_request_cache(UNCOMMITTED_CACHE_KEY)
+            snapshot = cache.get((key, value))
+            if snapshot is None:
+                snapshot = cache[(key, value)] = self.build_snapshot(value)
+            return snapshot
+
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.counter == value:
+            return snapshot
+
+        # threads requesting the same outdated snapshot wait for a single
+        # build instead of building it concurrently
+        with self._lock:
+            build_lock = self._build_locks[key]
+        with build_lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None and snapshot.counter == value:
+                return snapshot
+            built = self.build_snapshot(value)
+            # connections with an older view of the counter do not replace
+            # a newer snapshot
+            if snapshot is None or snapshot.counter < value:
+                self._snapshots[key] = built
+            return built
+
+    def build_snapshot(self, counter):
+        """Returns a new snapshot for the counter value passed in
+        """
+        return Snapshot(counter, self.build_records(),
+                        classes=self.build_class_records())
+
+    def build_records(self):
+        """Returns the antibiotic records from the catalog metadata
+        """
+        logger.info("Building antibiotic registry ...")
+        catalog = api.get_tool(SETUP_CATALOG)
+        records = []
+        for brain in catalog.unrestrictedSearchResults(
+                portal_type="Antibiotic"):
+            records.append(AntibioticRecord(
+                uid=api.get_uid(brain),
+                title=safe_unicode(brain.Title),
+                abbreviation=safe_unicode(brain.getAbbreviation or ""),
+                class_uid=brain.getRawAntibioticClass or None,
+                is_active=api.is_active(brain),
+                codes=tuple(brain.getExternalCodes or ())))
+        return records
+
+    def build_class_records(self):
+        """Returns the antibiotic class records from the catalog metadata
+        """
+        catalog = api.get_tool(SETUP_CATALOG)
+        records = []
+        for brain in catalog.unrestrictedSearchResults(
+                portal_type="AntibioticClass"):
+            records.append(AntibioticClassRecord(
+                uid=api.get_uid(brain),
+                title=safe_unicode(brain.Title),
+                is_active=api.is_active(brain)))
+        return records
+
+    def get_record(self, uid):
+        """Returns the antibiotic record for the UID passed in or None
+        """
+        return self.get_snapshot().get_record(uid)
+
+    def get_uid_by_title(self, title):
+        """Returns the UID of the antibiotic with the title passed in
+        """
+        return self.get_snapshot().get_uid_by_title(title)
+
+    def get_uid_by_abbreviation(self, abbreviation):
+        """Returns the UID of the antibiotic with the abbreviation passed in
+        """
+        return self.get_snapshot().get_uid_by_abbreviation(abbreviation)
+
+    def get_records(self):
+        """Returns all antibiotic records
+        """
+        return self.get_snapshot().records()
+
+    def get_class_records(self):
+        """Returns all antibiotic class records
+        """
+        return self.get_snapshot().class_records()
+
+    def resolve_codes(self, system, codes):
+        """Resolves the codes from the coding system passed in to antibiotic
+        UIDs. Returns a tuple (resolved, unknown)
+        """
+        return self.get_snapshot().resolve_codes(system, codes)
+
+    def search(self, term, limit=10, active_only=True):
+        """Returns the antibiotic records whose abbreviation or title start
+        with the term passed in
+        """
+        return self.get_snapshot().search(
+            term, limit=limit, active_only=active_only)
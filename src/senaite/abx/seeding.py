@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import collections
+import hashlib
+import json
+
+from bika.lims import api
+from senaite.abx import logger
+from senaite.abx.api import normalize
+from senaite.abx.importer import DEFAULT_CHUNK_SIZE
+from senaite.abx.importer import create_antibiotic
+from senaite.abx.importer import flush
+from senaite.abx.importer import get_antibiotic_classes_map
+from senaite.abx.registry import invalidate
+from senaite.abx.uniqueness import get_uniqueness_lookup
+from senaite.core.catalog import SETUP_CATALOG
+from zope.annotation.interfaces import IAnnotations
+
+# Folder annotation key of the hash of the last applied dataset
+HASH_KEY = "senaite.abx.seeding.hash"
+
+# Plan actions
+CREATE = "create"
+UPDATE = "update"
+SKIP = "skip"
+
+# Item of a seeding plan. Changes is a dict of field -> new value
+PlanItem = collections.namedtuple(
+    "PlanItem", ["action", "record", "uid", "changes"])
+
+
+def get_dataset_hash(portal_type, records):
+    """Returns a hash of the dataset passed in
+    """
+    data = json.dumps([portal_type, records], sort_keys=True)
+    return hashlib.sha1(data).hexdigest()
+
+
+def get_applied_hash(folder):
+    """Returns the hash of the dataset last applied to the folder
+    """
+    return IAnnotations(folder).get(HASH_KEY)
+
+
+def set_applied_hash(folder, value):
+    """Stores the hash of the dataset applied to the folder
+    """
+    IAnnotations(folder)[HASH_KEY] = value
+
+
+def get_changes(brain, record):
+    """Returns a dict with the values from the record to be set to the
+    existing item the brain represents. Only values that are missing in the
+    item are set, so that changes made by users are never overwritten
+    """
+    changes = {}
+    if record.get("abbreviation") and not brain.getAbbreviation:
+        changes["abbreviation"] = record["abbreviation"]
+    if record.get("antibiotic_class") and not brain.getRawAntibioticClass:
+        changes["antibiotic_class"] = record["antibiotic_class"]
+    codes = list(brain.getExternalCodes or [])
+    missing = [code for code in record.get("external_codes") or []
+               if code not in codes]
+    if missing:
+        changes["external_codes"] = codes + missing
+    return changes
+
+
+def compute_plan(folder, portal_type, records):
+    """Returns a list of PlanItem, one for each record dict passed in.
+
+    Records are matched against the existing items by normalized title in a
+    single pass over the catalog brains of the folder
+    """
+    query = {
+        "portal_type": portal_type,
+        "path": {"query": api.get_path(folder), "depth": 1},
+    }
+    existing = {}
+    for brain in api.search(query, SETUP_CATALOG):
+        existing.setdefault(normalize(api.get_title(brain)), brain)
+
+    plan = []
+    for record in records:
+        key = normalize(record.get("title"))
+        brain = existing.get(key)
+        if brain is None:
+            plan.append(PlanItem(CREATE, record, None, {}))
+            # do not create duplicates within the same dataset
+            existing[key] = None
+            continue
+        changes = get_changes(brain, record) if brain else {}
+        action = UPDATE if changes else SKIP
+        uid = api.get_uid(brain) if brain else None
+        plan.append(PlanItem(action, record, uid, changes))
+
+    if portal_type == "Antibiotic":
+        plan = skip_not_unique(folder, plan)
+    return plan
+
+
+def skip_not_unique(folder, plan):
+    """Replaces the creation of antibiotics whose title or abbreviation is
+    already in use by a skip and drops the abbreviation changes of updates
+    that would collide with another antibiotic. All candidates are validated
+    in a single pass
+    """
+    checks = []
+    records = []
+    for num, item in enumerate(plan):
+        if item.action == CREATE:
+            checks.append(num)
+            records.append(item.record)
+        elif item.action == UPDATE and "abbreviation" in item.changes:
+            checks.append(num)
+            records.append({
+                "uid": item.uid,
+                "abbreviation": item.changes["abbreviation"],
+            })
+
+    results = get_uniqueness_lookup(folder).validate_batch(records)
+    for num, conflicts in zip(checks, results):
+        if not conflicts:
+            continue
+        item = plan[num]
+        logger.warn("{} not unique: {} [SKIP]".format(
+            item.record.get("title"), ", ".join(conflicts.keys())))
+        if item.action == CREATE:
+            plan[num] = item._replace(action=SKIP)
+            continue
+        changes = dict(item.changes)
+        del changes["abbreviation"]
+        action = UPDATE if changes else SKIP
+        plan[num] = item._replace(action=action, changes=changes)
+    return plan
+
+
+def apply_plan(folder, portal_type, plan, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Applies the plan to the folder passed in.
+
+    Objects are reindexed once after all their values are set and the
+    indexing queue is processed every chunk_size operations
+    """
+    classes = {}
+    if portal_type == "Antibiotic":
+        classes = get_antibiotic_classes_map()
+
+    def get_class_uid(title):
+        uid = classes.get(normalize(title))
+        if not uid:
+            logger.error("Antibiotic class missing: '{}' [SKIP]".format(title))
+        return uid
+
+    count = 0
+    for item in plan:
+        if item.action == SKIP:
+            continue
+
+        record = item.record
+        title = record.get("title")
+        if item.action == CREATE:
+            logger.info("Adding {}: {}".format(portal_type, title))
+            if portal_type == "Antibiotic":
+                class_title = record.get("antibiotic_class")
+                class_uid = get_class_uid(class_title)
+                if class_title and not class_uid:
+                    continue
+                create_antibiotic(folder, title, record.get("abbreviation"),
+                                  antibiotic_class=class_uid,
+                                  description=record.get("description"),
+                                  external_codes=record.get("external_codes"))
+            else:
+                obj = api.create(folder, portal_type, title=title)
+                obj.reindexObject()
+
+        elif item.action == UPDATE:
+            logger.info("Updating {}: {}".format(portal_type, title))
+            obj = api.get_object_by_uid(item.uid)
+            changes = item.changes
+            if "abbreviation" in changes:
+                obj.setAbbreviation(changes["abbreviation"])
+            if "antibiotic_class" in changes:
+                class_uid = get_class_uid(changes["antibiotic_class"])
+                if class_uid:
+                    obj.setAntibioticClass(class_uid)
+            if "external_codes" in changes:
+                obj.setExternalCodes(changes["external_codes"])
+            obj.reindexObject()
+
+        count += 1
+        if count % chunk_size == 0:
+            flush()
+
+    flush()
+    return count
+
+
+def seed(folder, portal_type, records, dry_run=False, force=False,
+         chunk_size=DEFAULT_CHUNK_SIZE):
+    """Creates or updates the items of the portal type in the folder so they
+    match with the records passed in.
+
+    If the dataset did not change since it was last applied, nothing is done
+    unless force is True. If dry_run is True, the plan is computed and
+    returned, but not applied.
+
+    Returns the list of PlanItem
+    """
+    records = list(records)
+    dataset_hash = get_dataset_hash(portal_type, records)
+    if not force and get_applied_hash(folder) == dataset_hash:
+        logger.info("Dataset for {} already applied [SKIP]".format(
+            portal_type))
+        return []
+
+    plan = compute_plan(folder, portal_type, records)
+    summary = collections.Counter([item.action for item in plan])
+    logger.info("Seeding plan for {}: {} to create, {} to update, "
+                "{} to skip".format(portal_type, summary[CREATE],
+                                    summary[UPDATE], summary[SKIP]))
+    if dry_run:
+        return plan
+
+    apply_plan(folder, portal_type, plan, chunk_size=chunk_size)
+    set_applied_hash(folder, dataset_hash)
+    # no modified events are notified while seeding
+    invalidate()
+    return plan
@@ -25,12 +25,36 @@ from senaite.abx import PRODUCT_NAME
 from senaite.abx import PROFILE_ID
 from senaite.abx.config import ANTIBIOTIC_CLASSES
 from senaite.abx.config import ANTIBIOTICS
+from senaite.abx.seeding import CREATE
+from senaite.abx.seeding import seed
+from senaite.abx.uniqueness import build_uniqueness_index
+from senaite.core.catalog import SETUP_CATALOG
+from senaite.core.setuphandlers import setup_other_catalogs
 from zope.component import getUtility
 
 # Tuples of (folder_id, folder_name, type)
 SETUP_FOLDERS = [
     ("antibiotic_classes", "Antibiotic classes", "AntibioticClassFolder"),
     ("antibiotics", "Antibiotics", "AntibioticFolder"),
+    ("antibiotic_panels", "Antibiotic panels", "AntibioticPanelFolder"),
+]
+
+# Tuples of (catalog, index_name, index_attribute, index_type)
+INDEXES = [
+    (SETUP_CATALOG, "abbreviation", "", "FieldIndex"),
+    (SETUP_CATALOG, "getRawAntibioticClass", "", "FieldIndex"),
+    (SETUP_CATALOG, "sortable_class_title", "", "FieldIndex"),
+    (SETUP_CATALOG, "external_codes", "", "KeywordIndex"),
+]
+
+# Tuples of (catalog, column_name)
+COLUMNS = [
+    (SETUP_CATALOG, "getAbbreviation"),
+    (SETUP_CATALOG, "getRawAntibioticClass"),
+    (SETUP_CATALOG, "getExternalCodes"),
+    (SETUP_CATALOG, "getAntibioticClassTitle"),
+    (SETUP_CATALOG, "getAntibioticClassPath"),
+    (SETUP_CATALOG, "getRawAntibiotics"),
 ]
 
 
@@ -49,6 +73,12 @@ def setup_handler(context):
     # Configure visible navigation items
     setup_navigation_types(portal)
 
+    # Setup catalogs
+    setup_catalogs(portal)
+
+    # Setup the index of unique antibiotic titles and abbreviations
+    setup_uniqueness_index(portal)
+
     # Setup initial data
     setup_antibiotic_classes(portal)
     setup_antibiotics(portal)
@@ -94,28 +124,37 @@ def setup_navigation_types(portal):
     logger.info("Setup navigation types [DONE]")
 
 
+def setup_catalogs(portal):
+    """Setup the indexes and metadata columns required by senaite.abx
+    """
+    logger.info("Setup catalogs ...")
+    setup_other_catalogs(portal, indexes=INDEXES, columns=COLUMNS)
+    logger.info("Setup catalogs [DONE]")
+
+
+def setup_uniqueness_index(portal):
+    """Builds the index of unique antibiotic titles and abbreviations
+    """
+    logger.info("Setup antibiotics uniqueness index ...")
+    folder = api.get_setup().get("antibiotics")
+    build_uniqueness_index(folder)
+    logger.info("Setup antibiotics uniqueness index [DONE]")
+
+
 def setup_antibiotic_classes(portal):
     """Setup default antibiotic classes if do not exist yet
     """
     logger.info("Setup default antibiotic classes ...")
 
-    # Get the titles of the existing classes first
     folder = api.get_setup().get("antibiotic_classes")
-    existing = map(api.get_title, folder.objectValues())
+    records = [{"title": title} for title in ANTIBIOTIC_CLASSES]
+    plan = seed(folder, "AntibioticClass", records)
 
-    # Create the antibiotic classes
-    for ac in ANTIBIOTIC_CLASSES:
-        if ac in existing:
-            logger.warn("Antibiotic class {} already exists [SKIP]".format(ac))
-            continue
-
-        logger.info("Adding antibiotic class: {}".format(ac))
-        api.create(folder, "AntibioticClass", title=ac)
-
-    # Don't know why yet, but after adding the antibiotic classes, the folder
-    # looses the title
-    folder.title = "Antibiotic classes"
-    folder.reindexObject()
+    if any([item.action == CREATE for item in plan]):
+        # Don't know why yet, but after adding the antibiotic classes, the
+        # folder looses the title
+        folder.title = "Antibiotic classes"
+        folder.reindexObject()
 
     logger.info("Setup default antibiotic classes [DONE]")
 
@@ -125,44 +164,19 @@ def setup_antibiotics(portal):
     """
     logger.info("Setup default antibiotics ...")
 
-    # Get the titles of the existing antibiotics first
     folder = api.get_setup().get("antibiotics")
-    existing = map(api.get_title, folder.objectValues())
-
-    def get_antibiotic_class(name):
-        query = {
-            "portal_type": "AntibioticClass",
-            "title": name,
-        }
-        brains = api.search(query)
-        if len(brains) == 1:
-            return api.get_object(brains[0])
-        return None
-
-    # Create the antibiotic classes
+    records = []
     for name, props in ANTIBIOTICS:
-        if name in existing:
-            logger.warn("Antibiotic {} already exists [SKIP]".format(name))
-            continue
-
-        logger.info("Adding antibiotic: {}".format(name))
-
-        # Get the antibiotic class by name
-        a_class_name = props.get("antibiotic_class")
-        a_class = get_antibiotic_class(a_class_name)
-        if not a_class:
-            logger.error("Antibiotic class missing: '{}' [SKIP]".format(
-                a_class_name))
-            continue
-
-        obj = api.create(folder, "Antibiotic", title=name)
-        obj.setAntibioticClass(a_class)
-        obj.abbreviation = props.get("abbreviation")
-        obj.reindexObject()
-
-    # After adding the antibiotic, the folder looses the title
-    folder.title = "Antibiotics"
-    folder.reindexObject()
+        record = dict(props)
+        record["title"] = name
+        records.append(record)
+    plan = seed(folder, "Antibiotic", records)
+
+    if any([item.action == CREATE for item in plan]):
+        # After adding the antibiotic, the folder looses the title
+        folder.title = "Antibiotics"
+        folder.reindexObject()
+
     logger.info("Setup default antibiotics [DONE]")
 
 
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import transaction
+from bika.lims import api
+from Products.CMFCore.indexing import processQueue
+from senaite.abx import logger
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.registry import invalidate
+from senaite.abx.uniqueness import register_antibiotic
+from senaite.abx.uniqueness import unregister_antibiotic
+
+# Indexes of antibiotics that depend on the antibiotic class. Metadata is
+# always updated on reindex
+DEPENDENT_INDEXES = ["sortable_class_title"]
+
+# Number of dependent antibiotics reindexed before the queue is processed
+REINDEX_BATCH_SIZE = 500
+
+
+def invalidate_registry(obj, event):
+    """Invalidates the antibiotic registry when an antibiotic or antibiotic
+    class is added, modified, removed or transitioned
+    """
+    invalidate()
+
+
+def on_antibiotic_added_or_modified(antibiotic, event):
+    """Claims the title and abbreviation of the antibiotic in the uniqueness
+    index
+    """
+    register_antibiotic(antibiotic)
+
+
+def on_antibiotic_removed(antibiotic, event):
+    """Releases the title and abbreviation of the antibiotic
+    """
+    unregister_antibiotic(antibiotic, folder=event.oldParent)
+
+
+def on_antibiotic_class_modified(antibiotic_class, event):
+    """Schedules the reindex of the antibiotics assigned to the class, so
+    their denormalized class title and path are kept up-to-date
+    """
+    queue_dependents_reindex(api.get_uid(antibiotic_class))
+
+
+def queue_dependents_reindex(class_uid):
+    """Adds the antibiotic class to the classes whose antibiotics have to be
+    reindexed at the end of the current transaction. All classes modified
+    within the same transaction are handled in a single pass
+    """
+    txn = transaction.get()
+    for hook, args, kwargs in txn.getBeforeCommitHooks():
+        if hook is reindex_dependents:
+            args[0].add(class_uid)
+            return
+    txn.addBeforeCommitHook(reindex_dependents, args=(set([class_uid]), ))
+
+
+def reindex_dependents(class_uids, batch_size=REINDEX_BATCH_SIZE):
+    """Reindexes the dependent indexes and metadata of the antibiotics
+    assigned to the antibiotic classes passed in
+    """
+    brains = get_antibiotics_for_class(list(class_uids), active_only=False)
+    total = len(brains)
+    batch = []
+    for num, brain in enumerate(brains, start=1):
+        obj = api.get_object(brain)
+        obj.reindexObject(idxs=DEPENDENT_INDEXES)
+        batch.append(obj)
+        if num % batch_size == 0 or num == total:
+            processQueue()
+            # free the memory of the reindexed antibiotics
+            map(lambda obj: obj._p_deactivate(), batch)
+            batch = []
+            logger.info("Reindexed dependent antibiotics: {}/{}".format(
+                num, total))
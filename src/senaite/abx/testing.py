@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import contextlib
+import os
+import time
+
+from bika.lims import api
+from bika.lims.testing import BASE_LAYER_FIXTURE
+from plone.app.testing import applyProfile
+from plone.app.testing import FunctionalTesting
+from plone.app.testing import PloneSandboxLayer
+from plone.app.testing import setRoles
+from plone.app.testing import TEST_USER_ID
+from plone.testing import Layer
+from plone.testing import zope
+from senaite.abx.instrumentation import hook_catalog
+from senaite.abx.instrumentation import instrument
+from senaite.abx.instrumentation import unhook_catalog
+
+# Environment variables to configure the volume of the benchmark data
+ANTIBIOTICS_VOLUME_ENV = "SENAITE_ABX_BENCHMARK_ANTIBIOTICS"
+CLASSES_VOLUME_ENV = "SENAITE_ABX_BENCHMARK_CLASSES"
+
+
+class SimpleTestLayer(PloneSandboxLayer):
+    """Layer with senaite.abx installed
+    """
+    defaultBases = (BASE_LAYER_FIXTURE, )
+
+    def setUpZope(self, app, configurationContext):
+        super(SimpleTestLayer, self).setUpZope(app, configurationContext)
+
+        import senaite.abx
+        self.loadZCML(package=senaite.abx)
+        zope.installProduct(app, "senaite.abx")
+
+    def setUpPloneSite(self, portal):
+        super(SimpleTestLayer, self).setUpPloneSite(portal)
+        applyProfile(portal, "senaite.abx:default")
+
+
+class CatalogQueriesLayer(Layer):
+    """Layer that counts the queries against the setup catalog of every
+    connection while the instrumentation is active
+    """
+
+    def setUp(self):
+        hook_catalog()
+
+    def tearDown(self):
+        unhook_catalog()
+
+
+CATALOG_QUERIES_FIXTURE = CatalogQueriesLayer()
+
+
+class BenchmarkLayer(PloneSandboxLayer):
+    """Layer with senaite.abx installed and a configurable volume of
+    antibiotic classes and antibiotics
+    """
+    defaultBases = (BASE_LAYER_FIXTURE, CATALOG_QUERIES_FIXTURE)
+
+    def setUpZope(self, app, configurationContext):
+        super(BenchmarkLayer, self).setUpZope(app, configurationContext)
+
+        import senaite.abx
+        self.loadZCML(package=senaite.abx)
+        zope.installProduct(app, "senaite.abx")
+
+    def setUpPloneSite(self, portal):
+        super(BenchmarkLayer, self).setUpPloneSite(portal)
+        setRoles(portal, TEST_USER_ID, ["Manager"])
+
+        # the install on a fresh site is measured as well
+        start = time.time()
+        applyProfile(portal, "senaite.abx:default")
+        self["install_seconds"] = time.time() - start
+
+        self["antibiotics_volume"] = get_volume(ANTIBIOTICS_VOLUME_ENV, 10000)
+        self["classes_volume"] = get_volume(CLASSES_VOLUME_ENV, 500)
+        seed_volume(portal, self["classes_volume"],
+                    self["antibiotics_volume"])
+
+
+def get_volume(name, default):
+    """Returns the volume configured in the environment variable
+    """
+    return api.to_int(os.environ.get(name), default)
+
+
+def seed_volume(portal, classes, antibiotics):
+    """Creates the given number of synthetic antibiotic classes and
+    antibiotics, evenly distributed among classes
+    """
+    from senaite.abx.importer import import_antibiotics
+
+    setup = api.get_setup()
+    folder = setup.get("antibiotic_classes")
+    for num in range(classes):
+        obj = api.create(folder, "AntibioticClass",
+                         title="Benchmark Class {:05d}".format(num))
+        obj.reindexObject()
+
+    def records():
+        for num in range(antibiotics):
+            class_title = u""
+            if classes:
+                class_title = u"Benchmark Class {:05d}".format(num % classes)
+            yield {
+                "title": u"Benchmark Antibiotic {:06d}".format(num),
+                "abbreviation": u"BA{:06d}".format(num),
+                "antibiotic_class": class_title,
+            }
+
+    import_antibiotics(setup.get("antibiotics"), records())
+
+
+@contextlib.contextmanager
+def assert_budget(queries=None, loads=None):
+    """Asserts that the code run inside the context does not exceed the
+    given number of setup catalog queries and ZODB object loads, e.g.:
+
+        with assert_budget(queries=3, loads=20):
+            view.update()
+            view.folderitems()
+    """
+    with instrument() as stats:
+        yield stats
+    if queries is not None and stats.queries > queries:
+        raise AssertionError(
+            "{} catalog queries exceed the budget of {}".format(
+                stats.queries, queries))
+    if loads is not None and stats.loads > loads:
+        raise AssertionError(
+            "{} ZODB loads exceed the budget of {}".format(
+                stats.loads, loads))
+
+
+SIMPLE_FIXTURE = SimpleTestLayer()
+SIMPLE_TESTING = FunctionalTesting(
+    bases=(SIMPLE_FIXTURE, ),
+    name="senaite.abx:SimpleTesting")
+
+BENCHMARK_FIXTURE = BenchmarkLayer()
+BENCHMARK_TESTING = FunctionalTesting(
+    bases=(BENCHMARK_FIXTURE, ),
+    name="senaite.abx:BenchmarkTesting")
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import unittest
+
+from bika.lims import api
+from plone.app.testing import setRoles
+from plone.app.testing import TEST_USER_ID
+from Products.CMFCore.indexing import processQueue
+from senaite.abx.importer import create_antibiotic
+from senaite.abx.testing import SIMPLE_TESTING
+
+
+class SimpleTestCase(unittest.TestCase):
+    """Base class for tests on a site with senaite.abx installed
+    """
+    layer = SIMPLE_TESTING
+
+    def setUp(self):
+        self.portal = self.layer["portal"]
+        self.request = self.layer["request"]
+        setRoles(self.portal, TEST_USER_ID, ["Manager"])
+        setup = api.get_setup()
+        self.antibiotics = setup.get("antibiotics")
+        self.antibiotic_classes = setup.get("antibiotic_classes")
+
+    def create_class(self, title):
+        """Creates an antibiotic class with the title passed in
+        """
+        obj = api.create(self.antibiotic_classes, "AntibioticClass",
+                         title=title)
+        obj.reindexObject()
+        processQueue()
+        return obj
+
+    def create_antibiotic(self, title, abbreviation, antibiotic_class=None,
+                          external_codes=None):
+        """Creates an antibiotic, optionally assigned to the class passed in
+        """
+        class_uid = None
+        if antibiotic_class is not None:
+            class_uid = api.get_uid(antibiotic_class)
+        obj = create_antibiotic(self.antibiotics, title, abbreviation,
+                                antibiotic_class=class_uid,
+                                external_codes=external_codes)
+        processQueue()
+        return obj
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.breakpoints import Breakpoint
+from senaite.abx.breakpoints import get_breakpoint
+from senaite.abx.breakpoints import interpret
+from senaite.abx.breakpoints import make_key
+from senaite.abx.breakpoints import MIC
+from senaite.abx.breakpoints import remove_breakpoint
+from senaite.abx.breakpoints import set_breakpoint
+from senaite.abx.breakpoints import ZONE
+from senaite.abx.tests.base import SimpleTestCase
+
+
+class TestBreakpoints(SimpleTestCase):
+    """Classification of MIC and zone values against breakpoints
+    """
+
+    def test_classify_mic(self):
+        # EUCAST: S <= 1, R > 2
+        breakpoint = Breakpoint(make_key("EUCAST", 13, "Ent", MIC), (1, 2))
+        values = [0.5, 1, 1.5, 2, 4, None]
+        self.assertEqual(breakpoint.classify(values),
+                         ["S", "S", "I", "I", "R", None])
+
+        # CLSI: S <= 1, R >= 2
+        breakpoint = Breakpoint(make_key("CLSI", 33, "Ent", MIC), (1, 2))
+        self.assertEqual(breakpoint.classify([1, 1.5, 2]), ["S", "I", "R"])
+
+    def test_classify_zone(self):
+        # EUCAST: S >= 20, R < 17
+        breakpoint = Breakpoint(make_key("EUCAST", 13, "Ent", ZONE), (20, 17))
+        values = [25, 20, 18, 17, 16]
+        self.assertEqual(breakpoint.classify(values),
+                         ["S", "S", "I", "I", "R"])
+
+        # CLSI: S >= 20, R <= 17
+        breakpoint = Breakpoint(make_key("CLSI", 33, "Ent", ZONE), (20, 17))
+        self.assertEqual(breakpoint.classify([20, 18, 17]), ["S", "I", "R"])
+
+    def test_invalid_breakpoints(self):
+        antibiotic = self.create_antibiotic(u"Breakpoint Test", u"BPT")
+        self.assertRaises(ValueError, make_key, "XXX", 1, "Ent", MIC)
+        self.assertRaises(ValueError, make_key, "EUCAST", 1, "Ent", "xxx")
+        self.assertRaises(ValueError, set_breakpoint, antibiotic,
+                          "EUCAST", 13, "Ent", MIC, 4, 2)
+        self.assertRaises(ValueError, set_breakpoint, antibiotic,
+                          "EUCAST", 13, "Ent", ZONE, 17, 20)
+
+    def test_set_and_remove_breakpoint(self):
+        antibiotic = self.create_antibiotic(u"Breakpoint Test", u"BPT")
+        set_breakpoint(antibiotic, "EUCAST", 13, "Ent", MIC, 1, 2)
+        breakpoint = get_breakpoint(antibiotic, "EUCAST", 13, "Ent", MIC)
+        self.assertEqual(list(breakpoint.thresholds), [1.0, 2.0])
+        self.assertIsNone(
+            get_breakpoint(antibiotic, "EUCAST", 13, "Ent", ZONE))
+
+        remove_breakpoint(antibiotic, "EUCAST", 13, "Ent", MIC)
+        self.assertIsNone(
+            get_breakpoint(antibiotic, "EUCAST", 13, "Ent", MIC))
+
+    def test_interpret(self):
+        first = self.create_antibiotic(u"Breakpoint Test 1", u"BPT1")
+        second = self.create_antibiotic(u"Breakpoint Test 2", u"BPT2")
+        without = self.create_antibiotic(u"Breakpoint Test 3", u"BPT3")
+        set_breakpoint(first, "EUCAST", 13, "Ent", MIC, 1, 2)
+        set_breakpoint(second, "EUCAST", 13, "Ent", MIC, 0.25, 0.5)
+
+        uids = map(api.get_uid, [first, second, first, without, second])
+        values = [0.5, 0.5, 4, 1, None]
+        categories = interpret(uids, values, "EUCAST", 13, "Ent", MIC)
+        self.assertEqual(categories, ["S", "I", "R", None, None])
+
+        self.assertRaises(ValueError, interpret, uids, values[:2],
+                          "EUCAST", 13, "Ent", MIC)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from cStringIO import StringIO
+
+from bika.lims import api
+from senaite.abx.importer import CREATED
+from senaite.abx.importer import ERROR
+from senaite.abx.importer import import_antibiotics
+from senaite.abx.importer import parse_external_codes
+from senaite.abx.importer import read
+from senaite.abx.importer import SKIPPED
+from senaite.abx.tests.base import SimpleTestCase
+
+CSV = """title,abbreviation,antibiotic_class,external_codes
+Import Test 1,IMT1,Penicillins,"WHONET:IMT1; LOINC:123"
+Penicillin,PX,,
+Import Test 2,,,
+Import Test 3,IMT3,,foo
+Import Test 4,IMT4,Unknown Class,
+import test 1,IMT5,,
+Import Test 6,imt1,,
+"""
+
+JSON = """[{"title": "Import Test 7", "abbreviation": "IMT7",
+  "external_codes": ["WHONET:IMT7", "LOINC:777"]}]"""
+
+JSON_LINES = """{"title": "Import Test 8", "abbreviation": "IMT8"}
+
+{"title": "Import Test 9", "abbreviation": "IMT9"}
+"""
+
+
+class TestImporter(SimpleTestCase):
+    """Import of antibiotics from CSV and JSON files
+    """
+
+    def test_parse_external_codes(self):
+        codes, invalid = parse_external_codes(
+            u"WHONET:AMK, LOINC:123;EUCAST:amk  foo :x")
+        self.assertEqual(codes, [u"WHONET:AMK", u"LOINC:123", u"EUCAST:amk"])
+        self.assertEqual(invalid, [u"foo", u":x"])
+        self.assertEqual(parse_external_codes(None), ([], []))
+
+    def test_import_csv(self):
+        records = read(StringIO(CSV), "csv")
+        report = import_antibiotics(self.antibiotics, records)
+        self.assertEqual([item["status"] for item in report], [
+            CREATED, SKIPPED, ERROR, ERROR, ERROR, SKIPPED, SKIPPED])
+        self.assertEqual([item["row"] for item in report], range(1, 8))
+
+        antibiotic = api.get_object_by_uid(report[0]["uid"])
+        self.assertEqual(api.get_title(antibiotic), u"Import Test 1")
+        self.assertEqual(antibiotic.getAbbreviation(), u"IMT1")
+        self.assertEqual(antibiotic.getAntibioticClassTitle(), u"Penicillins")
+        self.assertEqual(antibiotic.getExternalCodes(),
+                         [u"WHONET:IMT1", u"LOINC:123"])
+
+    def test_import_json(self):
+        report = import_antibiotics(
+            self.antibiotics, read(StringIO(JSON), "json"))
+        self.assertEqual([item["status"] for item in report], [CREATED])
+        antibiotic = api.get_object_by_uid(report[0]["uid"])
+        self.assertEqual(antibiotic.getExternalCodes(),
+                         [u"WHONET:IMT7", u"LOINC:777"])
+        self.assertIsNone(antibiotic.getAntibioticClass())
+
+        report = import_antibiotics(
+            self.antibiotics, read(StringIO(JSON_LINES), "json"))
+        self.assertEqual([item["title"] for item in report],
+                         [u"Import Test 8", u"Import Test 9"])
+        self.assertEqual([item["status"] for item in report],
+                         [CREATED, CREATED])
+
+    def test_unsupported_format(self):
+        self.assertRaises(ValueError, read, StringIO(CSV), "xls")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.instrumentation import instrument
+from senaite.abx.instrumentation import is_catalog_hooked
+from senaite.abx.tests.base import SimpleTestCase
+from senaite.core.catalog import SETUP_CATALOG
+
+
+class TestInstrumentation(SimpleTestCase):
+    """Counting of the setup catalog queries outside the benchmark layer
+    """
+
+    def test_count_queries(self):
+        self.assertFalse(is_catalog_hooked())
+        catalog = api.get_tool(SETUP_CATALOG)
+        with instrument() as stats:
+            catalog(portal_type="Antibiotic")
+            catalog.searchResults(portal_type="AntibioticClass")
+            catalog.unrestrictedSearchResults(portal_type="Antibiotic")
+            api.search({"portal_type": "Antibiotic"}, SETUP_CATALOG)
+        self.assertEqual(stats.queries, 4)
+
+    def test_restore_catalog(self):
+        catalog = api.get_tool(SETUP_CATALOG)
+        with instrument():
+            self.assertIn("search", catalog._catalog.__dict__)
+        self.assertNotIn("search", catalog._catalog.__dict__)
+        self.assertFalse(catalog._catalog._p_changed)
+
+        # queries out of the context are not counted
+        with instrument() as stats:
+            pass
+        catalog(portal_type="Antibiotic")
+        self.assertEqual(stats.queries, 0)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import time
+
+from senaite.abx.jobs import DONE
+from senaite.abx.jobs import FAILED
+from senaite.abx.jobs import get_jobs_storage
+from senaite.abx.jobs import JOB_TIMEOUT
+from senaite.abx.jobs import recover_jobs
+from senaite.abx.jobs import RUNNING
+from senaite.abx.jobs import submit
+from senaite.abx.tests.base import SimpleTestCase
+
+
+class TestJobs(SimpleTestCase):
+    """Recovery of the jobs interrupted by a stopped process
+    """
+
+    def test_recover_jobs(self):
+        stale = submit("reindex")
+        running = submit("reindex")
+        finished = submit("reindex")
+        storage = get_jobs_storage()
+        now = time.time()
+        storage[stale].update({
+            "status": RUNNING,
+            "started": now - JOB_TIMEOUT - 60,
+            "updated": now - JOB_TIMEOUT - 10,
+        })
+        storage[running].update({
+            "status": RUNNING,
+            "started": now - JOB_TIMEOUT - 60,
+            "updated": now,
+        })
+        storage[finished].update({
+            "status": DONE,
+            "started": now - JOB_TIMEOUT - 60,
+            "updated": now - JOB_TIMEOUT - 10,
+        })
+
+        self.assertEqual(recover_jobs(storage), [stale])
+        self.assertEqual(storage[stale]["status"], FAILED)
+        self.assertEqual(storage[stale]["message"], u"Interrupted")
+        self.assertEqual(storage[running]["status"], RUNNING)
+        self.assertEqual(storage[finished]["status"], DONE)
+
+        # nothing left to recover
+        self.assertEqual(recover_jobs(storage), [])
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from bika.lims.workflow import doActionFor as do_action_for
+from Products.CMFCore.indexing import processQueue
+from senaite.abx.api import get_antibiotic_counts
+from senaite.abx.browser.content.antibioticfolder import AntibioticFolderView
+from senaite.abx.browser.content.antibioticfolder import UNCATEGORIZED
+from senaite.abx.tests.base import SimpleTestCase
+
+
+class TestAntibioticFolderView(SimpleTestCase):
+    """Lazy rendering of the antibiotics listing by antibiotic class
+    """
+
+    def setUp(self):
+        super(TestAntibioticFolderView, self).setUp()
+        self.antibiotic_class = self.create_class(u"Listing Test")
+        self.active = [
+            self.create_antibiotic(u"Listing Test {}".format(num),
+                                   u"LST{}".format(num),
+                                   antibiotic_class=self.antibiotic_class)
+            for num in range(2)
+        ]
+        self.inactive = self.create_antibiotic(
+            u"Listing Test 2", u"LST2",
+            antibiotic_class=self.antibiotic_class)
+        do_action_for(self.inactive, "deactivate")
+
+        # antibiotics without class or assigned to a removed class
+        removed = self.create_class(u"Listing Removed")
+        self.uncategorized = [
+            self.create_antibiotic(u"Listing Test 3", u"LST3"),
+            self.create_antibiotic(u"Listing Test 4", u"LST4",
+                                   antibiotic_class=removed),
+        ]
+        self.antibiotic_classes.manage_delObjects([removed.getId()])
+        processQueue()
+
+    def get_view(self, review_state="default"):
+        view = AntibioticFolderView(self.antibiotics, self.request)
+        self.request.form["{}_review_state".format(view.form_id)] = \
+            review_state
+        view.update()
+        view.before_render()
+        return view
+
+    def get_category(self, items, uid):
+        items = filter(lambda item: item["uid"] == uid, items)
+        return items[0] if items else None
+
+    def test_counts(self):
+        uid = api.get_uid(self.antibiotic_class)
+        self.assertEqual(get_antibiotic_counts()[uid], 3)
+        self.assertEqual(get_antibiotic_counts(is_active=True)[uid], 2)
+        self.assertEqual(get_antibiotic_counts(is_active=False)[uid], 1)
+
+    def test_category_items(self):
+        uid = api.get_uid(self.antibiotic_class)
+        items = self.get_view().folderitems()
+
+        # only a row per antibiotic class is rendered
+        self.assertEqual(filter(lambda item: item["parent"], items), [])
+        item = self.get_category(items, uid)
+        self.assertTrue(item["replace"]["Title"].endswith(u"(2)"))
+        self.assertEqual(item["children"], [uid])
+
+        items = self.get_view("inactive").folderitems()
+        item = self.get_category(items, uid)
+        self.assertTrue(item["replace"]["Title"].endswith(u"(1)"))
+
+    def test_children(self):
+        uid = api.get_uid(self.antibiotic_class)
+        children = self.get_view().get_children_hook(uid)
+        self.assertEqual(sorted([item["uid"] for item in children]),
+                         sorted(map(api.get_uid, self.active)))
+        self.assertEqual(set([item["parent"] for item in children]),
+                         set([uid]))
+
+        # the listing posts the children placeholder as child_uids
+        placeholder = self.get_view().get_children_hook(
+            uid, child_uids=[uid])
+        self.assertEqual([item["uid"] for item in placeholder],
+                         [item["uid"] for item in children])
+
+    def test_uncategorized(self):
+        view = self.get_view()
+        children = view.get_children_hook(UNCATEGORIZED)
+        uids = [item["uid"] for item in children]
+        for antibiotic in self.uncategorized:
+            self.assertIn(api.get_uid(antibiotic), uids)
+        for antibiotic in self.active:
+            self.assertNotIn(api.get_uid(antibiotic), uids)
+
+        # the row counts the same antibiotics the hook returns
+        item = self.get_category(view.folderitems(), UNCATEGORIZED)
+        self.assertTrue(item["replace"]["Title"].endswith(
+            u"({})".format(len(children))))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.reassign import reassign_antibiotics
+from senaite.abx.registry import get_registry
+from senaite.abx.tests.base import SimpleTestCase
+
+
+class TestReassign(SimpleTestCase):
+    """Reassignment of antibiotics to another antibiotic class
+    """
+
+    def setUp(self):
+        super(TestReassign, self).setUp()
+        self.source = self.create_class(u"Reassign Source")
+        self.target = self.create_class(u"Reassign Target")
+        self.reassigned = [
+            self.create_antibiotic(u"Reassign Test {}".format(num),
+                                   u"RAT{}".format(num),
+                                   antibiotic_class=self.source)
+            for num in range(3)
+        ]
+
+    def get_uids(self, antibiotic_class):
+        brains = get_antibiotics_for_class(
+            api.get_uid(antibiotic_class), active_only=False)
+        return sorted(map(api.get_uid, brains))
+
+    def test_reassign_class(self):
+        progress = []
+        count = reassign_antibiotics(
+            self.target, source=self.source, chunk_size=2,
+            progress=lambda done, total: progress.append((done, total)))
+        self.assertEqual(count, 3)
+        self.assertEqual(progress, [(2, 3), (3, 3)])
+
+        uids = sorted(map(api.get_uid, self.reassigned))
+        self.assertEqual(self.get_uids(self.target), uids)
+        self.assertEqual(self.get_uids(self.source), [])
+        self.assertTrue(api.is_active(self.source))
+
+        for antibiotic in self.reassigned:
+            self.assertEqual(antibiotic.getRawAntibioticClass(),
+                             api.get_uid(self.target))
+            record = get_registry().get_record(api.get_uid(antibiotic))
+            self.assertEqual(record.class_uid, api.get_uid(self.target))
+
+        # antibiotics already assigned to the target are not counted
+        self.assertEqual(reassign_antibiotics(self.target, uids=uids), 0)
+
+    def test_reassign_uids(self):
+        uid = api.get_uid(self.reassigned[0])
+        count = reassign_antibiotics(self.target, source=self.source,
+                                     uids=[uid], deactivate_source=True)
+        self.assertEqual(count, 1)
+        self.assertEqual(self.get_uids(self.target), [uid])
+        self.assertEqual(len(self.get_uids(self.source)), 2)
+        # the source class still has antibiotics
+        self.assertTrue(api.is_active(self.source))
+
+    def test_deactivate_source(self):
+        reassign_antibiotics(self.target, source=self.source,
+                             deactivate_source=True)
+        self.assertFalse(api.is_active(self.source))
+
+    def test_invalid_classes(self):
+        self.assertRaises(ValueError, reassign_antibiotics, self.source,
+                          source=self.source)
+        self.assertRaises(ValueError, reassign_antibiotics, self.target)
+        self.assertRaises(ValueError, reassign_antibiotics, "0" * 32,
+                          source=self.source)
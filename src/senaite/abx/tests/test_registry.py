@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import json
+
+from bika.lims import api
+from bika.lims.workflow import doActionFor as do_action_for
+from senaite.abx.api import resolve_codes
+from senaite.abx.browser.typeahead import AntibioticTypeaheadView
+from senaite.abx.registry import get_registry
+from senaite.abx.tests.base import SimpleTestCase
+from zope.globalrequest import setRequest
+
+
+class TestRegistry(SimpleTestCase):
+    """Typeahead search and external code lookups of the antibiotic registry
+    """
+
+    def search(self, term, **kwargs):
+        records = get_registry().search(term, **kwargs)
+        return [record.title for record in records]
+
+    def test_search(self):
+        # abbreviation matches come first
+        titles = self.search(u"P")
+        self.assertEqual(titles[0], u"Penicillin")
+
+        # matches are case and whitespace insensitive
+        self.assertEqual(self.search(u"  amik "), [u"Amikacin"])
+        self.assertEqual(self.search(u""), [])
+        self.assertEqual(len(self.search(u"a", limit=3)), 3)
+
+    def test_search_inactive(self):
+        antibiotic = self.create_antibiotic(u"Registry Test", u"RGT")
+        self.assertEqual(self.search(u"registry"), [u"Registry Test"])
+
+        do_action_for(antibiotic, "deactivate")
+        self.assertEqual(self.search(u"registry"), [])
+        self.assertEqual(self.search(u"registry", active_only=False),
+                         [u"Registry Test"])
+
+    def test_uncommitted_snapshot(self):
+        setRequest(self.request)
+        registry = get_registry()
+        self.create_antibiotic(u"Registry Snapshot", u"RGS")
+
+        # the snapshot with uncommitted changes is kept for the request
+        snapshot = registry.get_snapshot()
+        self.assertIsNotNone(snapshot.get_uid_by_abbreviation(u"RGS"))
+        self.assertIs(registry.get_snapshot(), snapshot)
+
+        # further changes build a new snapshot
+        self.create_antibiotic(u"Registry Snapshot 2", u"RGS2")
+        snapshot2 = registry.get_snapshot()
+        self.assertIsNot(snapshot2, snapshot)
+        self.assertIsNotNone(snapshot2.get_uid_by_abbreviation(u"RGS2"))
+
+    def test_typeahead_view(self):
+        self.request.form.update({"q": "amik", "limit": "100"})
+        view = AntibioticTypeaheadView(self.portal, self.request)
+        data = json.loads(view())
+        self.assertEqual(data["term"], "amik")
+        self.assertEqual([item["title"] for item in data["items"]],
+                         [u"Amikacin"])
+        content_type = self.request.response.getHeader("Content-Type")
+        self.assertTrue(content_type.startswith("application/json"))
+
+    def test_resolve_codes(self):
+        antibiotic = self.create_antibiotic(
+            u"Registry Test", u"RGT",
+            external_codes=[u"WHONET:RGT", u"LOINC:12345-6"])
+        uid = api.get_uid(antibiotic)
+
+        resolved, unknown = resolve_codes(
+            "whonet", ["RGT", "rgt", "XXX"])
+        self.assertEqual(resolved, {"RGT": uid, "rgt": uid})
+        self.assertEqual(unknown, ["XXX"])
+
+        resolved, unknown = resolve_codes("LOINC", ["12345-6", "RGT"])
+        self.assertEqual(resolved, {"12345-6": uid})
+        self.assertEqual(unknown, ["RGT"])
+
+        # codes of the default antibiotics
+        resolved, unknown = resolve_codes("WHONET", ["PEN", "AMK"])
+        self.assertEqual(sorted(resolved.keys()), ["AMK", "PEN"])
+        self.assertEqual(unknown, [])
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.seeding import compute_plan
+from senaite.abx.seeding import CREATE
+from senaite.abx.seeding import seed
+from senaite.abx.seeding import SKIP
+from senaite.abx.seeding import UPDATE
+from senaite.abx.tests.base import SimpleTestCase
+from senaite.core.catalog import SETUP_CATALOG
+
+
+class TestSeeding(SimpleTestCase):
+    """Seeding plan of the default antibiotics
+    """
+
+    def get_actions(self, plan):
+        return [item.action for item in plan]
+
+    def test_compute_plan(self):
+        records = [
+            # default antibiotic, unchanged
+            {"title": u"Penicillin", "abbreviation": u"P",
+             "antibiotic_class": u"Penicillins",
+             "external_codes": [u"WHONET:PEN"]},
+            {"title": u"Seeding Test", "abbreviation": u"SDT"},
+            # abbreviation of Penicillin
+            {"title": u"Seeding Test 2", "abbreviation": u"p"},
+            # duplicate within the dataset
+            {"title": u"seeding test", "abbreviation": u"SDT"},
+        ]
+        plan = compute_plan(self.antibiotics, "Antibiotic", records)
+        self.assertEqual(self.get_actions(plan), [SKIP, CREATE, SKIP, SKIP])
+
+    def test_plan_updates(self):
+        self.create_antibiotic(u"Seeding Update", u"")
+        self.create_antibiotic(u"Seeding Update 2", u"")
+        records = [
+            {"title": u"Penicillin",
+             "external_codes": [u"WHONET:PEN", u"EUCAST:PEN"]},
+            {"title": u"Seeding Update", "abbreviation": u"SDU",
+             "antibiotic_class": u"Penicillins"},
+            # abbreviation of Penicillin
+            {"title": u"Seeding Update 2", "abbreviation": u"P",
+             "external_codes": [u"WHONET:SDU2"]},
+        ]
+        plan = compute_plan(self.antibiotics, "Antibiotic", records)
+        self.assertEqual(self.get_actions(plan), [UPDATE, UPDATE, UPDATE])
+        self.assertEqual(plan[0].changes, {
+            "external_codes": [u"WHONET:PEN", u"EUCAST:PEN"]})
+        self.assertEqual(plan[1].changes, {
+            "abbreviation": u"SDU", "antibiotic_class": u"Penicillins"})
+        self.assertEqual(plan[2].changes, {
+            "external_codes": [u"WHONET:SDU2"]})
+
+        # the abbreviation of an antibiotic is never overwritten
+        records = [{"title": u"Penicillin", "abbreviation": u"PEN"}]
+        plan = compute_plan(self.antibiotics, "Antibiotic", records)
+        self.assertEqual(self.get_actions(plan), [SKIP])
+
+    def test_seed(self):
+        records = [
+            {"title": u"Seeding Test", "abbreviation": u"SDT",
+             "antibiotic_class": u"Penicillins",
+             "external_codes": [u"WHONET:SDT"]},
+        ]
+        query = {"portal_type": "Antibiotic", "title": "Seeding Test"}
+
+        plan = seed(self.antibiotics, "Antibiotic", records, dry_run=True)
+        self.assertEqual(self.get_actions(plan), [CREATE])
+        self.assertEqual(len(api.search(query, SETUP_CATALOG)), 0)
+
+        plan = seed(self.antibiotics, "Antibiotic", records)
+        self.assertEqual(self.get_actions(plan), [CREATE])
+        brains = api.search(query, SETUP_CATALOG)
+        self.assertEqual(len(brains), 1)
+        antibiotic = api.get_object(brains[0])
+        self.assertEqual(antibiotic.getAbbreviation(), u"SDT")
+        self.assertEqual(antibiotic.getAntibioticClassTitle(), u"Penicillins")
+        self.assertEqual(antibiotic.getExternalCodes(), [u"WHONET:SDT"])
+
+        # the dataset is applied only once, unless forced
+        self.assertEqual(seed(self.antibiotics, "Antibiotic", records), [])
+        plan = seed(self.antibiotics, "Antibiotic", records, force=True)
+        self.assertEqual(self.get_actions(plan), [SKIP])
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.tests.base import SimpleTestCase
+from senaite.abx.uniqueness import ANNOTATION_KEY
+from senaite.abx.uniqueness import get_uniqueness_index
+from senaite.abx.uniqueness import get_uniqueness_lookup
+from senaite.abx.uniqueness import UniquenessIndex
+from zope.annotation.interfaces import IAnnotations
+
+
+class TestUniqueness(SimpleTestCase):
+    """Uniqueness of the titles and abbreviations of antibiotics
+    """
+
+    def test_conflicts(self):
+        index = UniquenessIndex()
+        self.assertEqual(index.register("uid-1", u"Amoxicillin", u"Amx"), {})
+
+        # keys are compared normalized
+        conflicts = index.get_conflicts(title=u"  AMOXICILLIN ",
+                                        abbreviation=u"amx")
+        self.assertEqual(conflicts, {"title": "uid-1",
+                                     "abbreviation": "uid-1"})
+
+        # the antibiotic does not conflict with itself
+        self.assertEqual(index.get_conflicts(title=u"Amoxicillin",
+                                             uid="uid-1"), {})
+
+        # keys claimed by another antibiotic are returned, but never raised
+        conflicts = index.register("uid-2", u"Amoxicillin", u"Amx2")
+        self.assertEqual(conflicts, {"title": "uid-1"})
+        self.assertEqual(index.get_conflicts(abbreviation=u"Amx2"),
+                         {"abbreviation": "uid-2"})
+
+        # keys are released on unregister
+        index.unregister("uid-1")
+        self.assertEqual(index.get_conflicts(title=u"Amoxicillin"), {})
+
+    def test_validate_batch(self):
+        index = UniquenessIndex()
+        index.register("uid-1", u"Amoxicillin", u"Amx")
+        records = [
+            {"title": u"Amoxicillin", "abbreviation": u"A1"},
+            {"title": u"Ampicillin", "abbreviation": u"Am"},
+            {"title": u"ampicillin", "abbreviation": u"A2"},
+            {"uid": "uid-1", "abbreviation": u"Amx"},
+        ]
+        results = index.validate_batch(records)
+        self.assertEqual(results, [
+            {"title": "uid-1"},
+            {},
+            {"title": "row:1"},
+            {},
+        ])
+
+    def test_antibiotic_index(self):
+        index = get_uniqueness_index(self.antibiotics)
+        self.assertIsNotNone(index)
+
+        antibiotic = self.create_antibiotic(u"Uniqueness Test", u"UQT")
+        uid = api.get_uid(antibiotic)
+        self.assertEqual(index.get_conflicts(title=u"uniqueness test"),
+                         {"title": uid})
+
+        antibiotic.setAbbreviation(u"UQT2")
+        self.assertEqual(index.get_conflicts(abbreviation=u"UQT"), {})
+        self.assertEqual(index.get_conflicts(abbreviation=u"UQT2"),
+                         {"abbreviation": uid})
+
+    def test_lookup_without_index(self):
+        antibiotic = self.create_antibiotic(u"Uniqueness Test", u"UQT")
+        annotations = IAnnotations(self.antibiotics)
+        del annotations[ANNOTATION_KEY]
+
+        # the missing index is built from the catalog once and stored
+        lookup = get_uniqueness_lookup(antibiotic)
+        self.assertEqual(lookup.get_conflicts(abbreviation=u"UQT"),
+                         {"abbreviation": api.get_uid(antibiotic)})
+        self.assertIs(get_uniqueness_index(antibiotic), lookup)
+        self.assertIs(get_uniqueness_lookup(antibiotic), lookup)
+
+        # the index is built on the first write as well
+        del annotations[ANNOTATION_KEY]
+        antibiotic.setAbbreviation(u"UQT2")
+        index = get_uniqueness_index(antibiotic)
+        self.assertIsNotNone(index)
+        self.assertEqual(index.get_conflicts(abbreviation=u"UQT2"),
+                         {"abbreviation": api.get_uid(antibiotic)})
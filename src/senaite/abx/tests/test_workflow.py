@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from bika.lims import api
+from senaite.abx.tests.base import SimpleTestCase
+from senaite.abx.workflow import deactivate_classes
+from senaite.abx.workflow import do_action_for_uids
+
+
+class TestWorkflow(SimpleTestCase):
+    """Batched transitions of antibiotics and antibiotic classes
+    """
+
+    def test_do_action_for_uids(self):
+        antibiotics = [
+            self.create_antibiotic(u"Workflow Test {}".format(num),
+                                   u"WFT{}".format(num))
+            for num in range(5)]
+        uids = map(api.get_uid, antibiotics)
+
+        transitioned = do_action_for_uids("deactivate", uids, batch_size=2)
+        self.assertEqual(sorted(transitioned), sorted(uids))
+        self.assertFalse(any(map(api.is_active, antibiotics)))
+
+        # objects that cannot be transitioned are not returned
+        self.assertEqual(do_action_for_uids("deactivate", uids), [])
+
+    def test_deactivate_classes(self):
+        antibiotic_class = self.create_class(u"Workflow Class")
+        antibiotic = self.create_antibiotic(u"Workflow Cascade", u"WFC",
+                                            antibiotic_class=antibiotic_class)
+
+        deactivated = deactivate_classes([api.get_uid(antibiotic_class)])
+        self.assertEqual(deactivated, [api.get_uid(antibiotic_class)])
+        self.assertFalse(api.is_active(antibiotic_class))
+        self.assertFalse(api.is_active(antibiotic))
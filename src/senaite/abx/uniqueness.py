@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from Acquisition import aq_parent
+from BTrees.OOBTree import OOBTree
+from bika.lims import api
+from persistent import Persistent
+from senaite.abx import logger
+from senaite.abx.api import normalize
+from senaite.abx.interfaces import IAntibioticFolder
+from senaite.core.catalog import SETUP_CATALOG
+from zope.annotation.interfaces import IAnnotations
+
+# Folder annotation key of the uniqueness index
+ANNOTATION_KEY = "senaite.abx.uniqueness"
+
+# Fields that must be unique
+TITLE = "title"
+ABBREVIATION = "abbreviation"
+
+
+class UniquenessIndex(Persistent):
+    """Persistent maps of normalized title and abbreviation -> UID.
+
+    Lookups and updates are O(log n). Two transactions claiming the same key
+    concurrently write the same BTree bucket and conflict at the ZODB level,
+    so the second one is retried. The retry is only rejected if a form
+    invariant or validate_batch runs again, since register keeps the values
+    stored
+    """
+
+    def __init__(self):
+        self.keys = {
+            TITLE: OOBTree(),
+            ABBREVIATION: OOBTree(),
+        }
+        # UID -> (title key, abbreviation key)
+        self.uids = OOBTree()
+
+    def rebuild(self, folder):
+        """Rebuilds the index from the catalog metadata of the antibiotics of
+        the folder passed in. Existing duplicates are kept by the first one
+        """
+        logger.info("Rebuilding antibiotics uniqueness index ...")
+        for tree in self.keys.values():
+            tree.clear()
+        self.uids.clear()
+
+        query = {
+            "portal_type": "Antibiotic",
+            "path": {"query": api.get_path(folder), "depth": 1},
+        }
+        catalog = api.get_tool(SETUP_CATALOG)
+        for brain in catalog.unrestrictedSearchResults(query):
+            uid = api.get_uid(brain)
+            keys = (normalize(brain.Title), normalize(brain.getAbbreviation))
+            self.uids[uid] = keys
+            for field, key in zip((TITLE, ABBREVIATION), keys):
+                if key and key not in self.keys[field]:
+                    self.keys[field][key] = uid
+        logger.info("Rebuilding antibiotics uniqueness index [DONE]")
+
+    def get_conflicts(self, title=None, abbreviation=None, uid=None):
+        """Returns a dict of field -> UID of the antibiotic already using the
+        title or abbreviation passed in. The antibiotic with the given UID is
+        not considered a conflict
+        """
+        conflicts = {}
+        values = ((TITLE, title), (ABBREVIATION, abbreviation))
+        for field, value in values:
+            key = normalize(value)
+            if not key:
+                continue
+            owner = self.keys[field].get(key)
+            if owner and owner != uid:
+                conflicts[field] = owner
+        return conflicts
+
+    def validate_batch(self, records):
+        """Validates a set of record dicts with the keys "title" and
+        "abbreviation" in a single pass, against the index and against the
+        other records. Returns a list with a conflicts dict per record
+        """
+        seen = {TITLE: {}, ABBREVIATION: {}}
+        results = []
+        for num, record in enumerate(records):
+            conflicts = self.get_conflicts(
+                title=record.get(TITLE),
+                abbreviation=record.get(ABBREVIATION),
+                uid=record.get("uid"))
+            for field in (TITLE, ABBREVIATION):
+                key = normalize(record.get(field))
+                if not key:
+                    continue
+                if key in seen[field]:
+                    conflicts.setdefault(field, seen[field][key])
+                else:
+                    seen[field][key] = "row:{}".format(num)
+            results.append(conflicts)
+        return results
+
+    def register(self, uid, title, abbreviation):
+        """Claims the title and abbreviation for the antibiotic with the UID
+        passed in. Keys already claimed by another antibiotic are kept by
+        their owner and returned as a dict of field -> owner UID.
+
+        Uniqueness is enforced by the form invariants and validate_batch, so
+        that the values stored are never rejected here
+        """
+        keys = (normalize(title), normalize(abbreviation))
+        if self.uids.get(uid) == keys:
+            return {}
+
+        self.unregister(uid)
+        self.uids[uid] = keys
+        conflicts = {}
+        for field, key in zip((TITLE, ABBREVIATION), keys):
+            if not key:
+                continue
+            owner = self.keys[field].get(key)
+            if owner is None:
+                self.keys[field][key] = uid
+            elif owner != uid:
+                conflicts[field] = owner
+        if conflicts:
+            logger.warn("Antibiotic {} not unique: {}".format(
+                uid, ", ".join(sorted(conflicts.keys()))))
+        return conflicts
+
+    def unregister(self, uid):
+        """Releases the title and abbreviation of the antibiotic
+        """
+        keys = self.uids.pop(uid, None)
+        if not keys:
+            return
+        for field, key in zip((TITLE, ABBREVIATION), keys):
+            if key and self.keys[field].get(key) == uid:
+                del self.keys[field][key]
+
+
+def get_antibiotic_folder(context=None):
+    """Returns the antibiotic folder the context belongs to or the default
+    antibiotic folder from setup
+    """
+    if IAntibioticFolder.providedBy(context):
+        return context
+    parent = aq_parent(context) if context is not None else None
+    if IAntibioticFolder.providedBy(parent):
+        return parent
+    return api.get_setup().get("antibiotics")
+
+
+def build_uniqueness_index(folder):
+    """Creates, if necessary, and rebuilds the persistent uniqueness index of
+    the antibiotic folder passed in. Called on install and upgrade, and once
+    if the index is missing
+    """
+    annotations = IAnnotations(folder)
+    index = annotations.get(ANNOTATION_KEY)
+    if index is None:
+        index = annotations[ANNOTATION_KEY] = UniquenessIndex()
+    index.rebuild(folder)
+    return index
+
+
+def get_uniqueness_index(context=None):
+    """Returns the persistent uniqueness index of the antibiotic folder the
+    context belongs to or None if it was not built yet
+    """
+    folder = get_antibiotic_folder(context)
+    if folder is None:
+        return None
+    return IAnnotations(folder).get(ANNOTATION_KEY)
+
+
+def get_uniqueness_lookup(context=None):
+    """Returns the uniqueness index of the antibiotic folder the context
+    belongs to. If the persistent index is missing, e.g. because the upgrade
+    step was not run yet, it is built from the catalog and stored
+    """
+    index = get_uniqueness_index(context)
+    if index is not None:
+        return index
+    folder = get_antibiotic_folder(context)
+    if folder is None:
+        return UniquenessIndex()
+    logger.warn("Uniqueness index of {} is missing".format(
+        api.get_path(folder)))
+    return build_uniqueness_index(folder)
+
+
+def register_antibiotic(antibiotic):
+    """Claims the title and abbreviation of the antibiotic passed in. The
+    uniqueness index is built on the first write if it is missing
+    """
+    uid = api.get_uid(antibiotic)
+    if not uid:
+        return
+    index = get_uniqueness_lookup(antibiotic)
+    index.register(uid, api.get_title(antibiotic),
+                   antibiotic.getAbbreviation())
+
+
+def unregister_antibiotic(antibiotic, folder=None):
+    """Releases the title and abbreviation of the antibiotic passed in
+    """
+    uid = api.get_uid(antibiotic)
+    index = get_uniqueness_index(folder or antibiotic)
+    if not uid or index is None:
+        return
+    index.unregister(uid)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import time
+
+import transaction
+from bika.lims import api
+from BTrees.OOBTree import OOBTree
+from persistent.mapping import PersistentMapping
+from Products.CMFCore.indexing import processQueue
+from senaite.abx import logger
+from ZODB.POSException import ConflictError
+from zope.annotation.interfaces import IAnnotations
+
+# Portal annotation key of the progress of chunked migrations
+PROGRESS_KEY = "senaite.abx.upgrade.progress"
+
+# Number of items to process before each commit
+DEFAULT_CHUNK_SIZE = 500
+
+# Number of times a chunk is retried on ConflictError
+DEFAULT_RETRIES = 3
+
+
+def get_progress_storage():
+    """Returns the persistent storage of the migrations progress
+    """
+    annotations = IAnnotations(api.get_portal())
+    storage = annotations.get(PROGRESS_KEY)
+    if storage is None:
+        storage = annotations[PROGRESS_KEY] = OOBTree()
+    return storage
+
+
+def get_progress(name, ids):
+    """Returns the persisted progress of the migration with the given name,
+    or a new one for the ids passed in
+    """
+    storage = get_progress_storage()
+    progress = storage.get(name)
+    if progress is None:
+        progress = PersistentMapping()
+        progress["ids"] = tuple(ids)
+        progress["done"] = 0
+        storage[name] = progress
+    return progress
+
+
+def process_in_chunks(name, ids, func, chunk_size=DEFAULT_CHUNK_SIZE,
+                      retries=DEFAULT_RETRIES):
+    """Calls func with each id of the list passed in.
+
+    The transaction is committed and the ZODB cache minimized after every
+    chunk_size ids. The ids and the number of ids processed are persisted
+    under the given name, so that a restarted migration resumes after the
+    last committed chunk. Chunks are retried on ConflictError
+    """
+    progress = get_progress(name, ids)
+    ids = progress["ids"]
+    total = len(ids)
+    done = progress["done"]
+    if done:
+        logger.info("{}: resuming at {}/{}".format(name, done, total))
+
+    jar = api.get_portal()._p_jar
+    start = time.time()
+    resumed_at = done
+    while done < total:
+        chunk = ids[done:done + chunk_size]
+        for attempt in range(retries + 1):
+            try:
+                map(func, chunk)
+                processQueue()
+                progress["done"] = done + len(chunk)
+                transaction.commit()
+                break
+            except ConflictError:
+                transaction.abort()
+                if attempt == retries:
+                    raise
+                logger.warn("{}: conflict, retrying chunk {}-{}".format(
+                    name, done, done + len(chunk)))
+                # the progress object is invalidated on abort
+                progress = get_progress(name, ids)
+
+        done += len(chunk)
+        jar.cacheMinimize()
+        elapsed = time.time() - start
+        rate = (done - resumed_at) / elapsed if elapsed else 0
+        logger.info("{}: {}/{} ({:.1f} items/s)".format(
+            name, done, total, rate))
+
+    # forget the progress once done
+    get_progress_storage().pop(name, None)
+    logger.info("{}: {} items processed in {:.1f}s".format(
+        name, total, time.time() - start))
@@ -23,6 +23,7 @@ from Products.BTreeFolder2.BTreeFolder2 import BTreeFolder2Base
 from senaite.abx import logger
 from senaite.abx import PRODUCT_NAME
 from senaite.abx.content.antibiotic import Antibiotic
+from senaite.abx.upgrade.utils import process_in_chunks
 from senaite.core.upgrade import upgradestep
 from senaite.core.upgrade.utils import UpgradeUtils
 
@@ -76,12 +77,16 @@ def remove_antibiotic_behavior(tool):
     # Antibiotic content type is now folderish
     setup = api.get_setup()
     antibiotics = setup.antibiotics
-    for antibiotic in antibiotics.objectValues():
-        id = antibiotic.getId()
+
+    def migrate(id):
+        antibiotic = antibiotics._getOb(id)
         antibiotics._delOb(id)
         antibiotic.__class__ = Antibiotic
         antibiotics._setOb(id, antibiotic)
         BTreeFolder2Base._initBTrees(antibiotics[id])
         antibiotics[id].reindexObject()
 
+    process_in_chunks("remove_antibiotic_behavior", antibiotics.objectIds(),
+                      migrate)
+
     logger.info("Remove IAntibioticBehavior behavior [DONE]")
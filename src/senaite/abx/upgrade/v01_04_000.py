@@ -18,8 +18,16 @@
 # Copyright 2020-2025 by it's authors.
 # Some rights reserved, see README and LICENSE.
 
+from bika.lims import api
 from senaite.abx import logger
 from senaite.abx import PRODUCT_NAME
+from senaite.abx.setuphandlers import add_setup_folders
+from senaite.abx.setuphandlers import setup_antibiotics
+from senaite.abx.setuphandlers import setup_catalogs
+from senaite.abx.setuphandlers import setup_navigation_types
+from senaite.abx.uniqueness import build_uniqueness_index
+from senaite.abx.upgrade.utils import process_in_chunks
+from senaite.core.catalog import SETUP_CATALOG
 from senaite.core.upgrade import upgradestep
 from senaite.core.upgrade.utils import UpgradeUtils
 
@@ -46,3 +54,99 @@ def upgrade(tool):
 
     logger.info("{0} upgraded to version {1}".format(PRODUCT_NAME, version))
     return True
+
+
+def setup_abbreviation_index(tool):
+    """Adds and populates the normalized abbreviation index
+    """
+    logger.info("Setup abbreviation index ...")
+    portal = api.get_portal()
+    setup_catalogs(portal)
+    logger.info("Setup abbreviation index [DONE]")
+
+
+def setup_antibiotic_columns(tool):
+    """Adds the antibiotic metadata columns and reindexes all antibiotics, so
+    that the antibiotics listing can be rendered from brains only
+    """
+    logger.info("Setup antibiotic metadata columns ...")
+    portal = api.get_portal()
+    setup_catalogs(portal)
+
+    brains = api.search({"portal_type": "Antibiotic"}, SETUP_CATALOG)
+
+    def reindex(uid):
+        api.get_object_by_uid(uid).reindexObject()
+
+    process_in_chunks("setup_antibiotic_columns", map(api.get_uid, brains),
+                      reindex)
+
+    logger.info("Setup antibiotic metadata columns [DONE]")
+
+
+def setup_antibiotic_class_index(tool):
+    """Adds and populates the antibiotic class reference index
+    """
+    logger.info("Setup antibiotic class index ...")
+    portal = api.get_portal()
+    setup_catalogs(portal)
+    logger.info("Setup antibiotic class index [DONE]")
+
+
+def setup_uniqueness_index(tool):
+    """Builds the index of unique antibiotic titles and abbreviations
+    """
+    logger.info("Setup antibiotics uniqueness index ...")
+    folder = api.get_setup().get("antibiotics")
+    build_uniqueness_index(folder)
+    logger.info("Setup antibiotics uniqueness index [DONE]")
+
+
+def setup_sortable_indexes(tool):
+    """Adds and populates the index to sort antibiotics by class title
+    """
+    logger.info("Setup sortable indexes ...")
+    portal = api.get_portal()
+    setup_catalogs(portal)
+    logger.info("Setup sortable indexes [DONE]")
+
+
+def setup_external_codes(tool):
+    """Adds the external codes index and metadata column and seeds the
+    external codes of the default antibiotics
+    """
+    logger.info("Setup external codes ...")
+    portal = api.get_portal()
+    setup_catalogs(portal)
+    setup_antibiotics(portal)
+    logger.info("Setup external codes [DONE]")
+
+
+def setup_antibiotic_panels(tool):
+    """Adds the antibiotic panel types and the antibiotic panels folder
+    """
+    logger.info("Setup antibiotic panels ...")
+    portal = api.get_portal()
+    setup = portal.portal_setup
+    setup.runImportStepFromProfile(profile, "typeinfo")
+    setup.runImportStepFromProfile(profile, "workflow")
+    add_setup_folders(portal)
+    setup_navigation_types(portal)
+    setup_catalogs(portal)
+    logger.info("Setup antibiotic panels [DONE]")
+
+
+def setup_uncategorized_antibiotics(tool):
+    """Reindexes the antibiotic class of the antibiotics without class, so
+    that they are indexed with an empty value
+    """
+    logger.info("Setup uncategorized antibiotics ...")
+    brains = api.search({"portal_type": "Antibiotic"}, SETUP_CATALOG)
+    uids = [api.get_uid(b) for b in brains if not b.getRawAntibioticClass]
+
+    def reindex(uid):
+        obj = api.get_object_by_uid(uid)
+        obj.reindexObject(idxs=["getRawAntibioticClass"])
+
+    process_in_chunks("setup_uncategorized_antibiotics", uids, reindex)
+    logger.info("Setup uncategorized antibiotics [DONE]")
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+from senaite.abx.registry import get_registry
+from zope.interface import implementer
+from zope.schema.interfaces import IVocabularyFactory
+from zope.schema.vocabulary import SimpleTerm
+from zope.schema.vocabulary import SimpleVocabulary
+
+
+def get_cached_vocabulary(name, build):
+    """Returns the vocabulary with the given name from the registry snapshot.
+    The vocabulary is built with the function passed in if not cached yet,
+    and it is built again only when the registry is invalidated
+    """
+    snapshot = get_registry().get_snapshot()
+    vocabulary = snapshot.cache.get(name)
+    if vocabulary is None:
+        vocabulary = snapshot.cache[name] = build(snapshot)
+    return vocabulary
+
+
+def make_vocabulary(terms):
+    """Returns a SimpleVocabulary with the terms sorted by title
+    """
+    terms = sorted(terms, key=lambda term: term.title.lower())
+    return SimpleVocabulary(terms)
+
+
+@implementer(IVocabularyFactory)
+class AntibioticsVocabulary(object):
+    """Vocabulary of active antibiotics
+    """
+    name = "senaite.abx.vocabularies.antibiotics"
+
+    def build(self, snapshot):
+        """Returns the vocabulary of the antibiotics from the snapshot
+        """
+        terms = []
+        for record in snapshot.records():
+            if not record.is_active:
+                continue
+            title = record.title
+            if record.abbreviation:
+                title = u"{} ({})".format(title, record.abbreviation)
+            terms.append(SimpleTerm(record.uid, record.uid, title))
+        return make_vocabulary(terms)
+
+    def __call__(self, context):
+        return get_cached_vocabulary(self.name, self.build)
+
+
+@implementer(IVocabularyFactory)
+class AntibioticClassesVocabulary(object):
+    """Vocabulary of active antibiotic classes
+    """
+    name = "senaite.abx.vocabularies.antibiotic_classes"
+
+    def build(self, snapshot):
+        """Returns the vocabulary of the antibiotic classes from the snapshot
+        """
+        terms = []
+        for record in snapshot.class_records():
+            if not record.is_active:
+                continue
+            terms.append(SimpleTerm(record.uid, record.uid, record.title))
+        return make_vocabulary(terms)
+
+    def __call__(self, context):
+        return get_cached_vocabulary(self.name, self.build)
+
+
+AntibioticsVocabularyFactory = AntibioticsVocabulary()
+
+AntibioticClassesVocabularyFactory = AntibioticClassesVocabulary()
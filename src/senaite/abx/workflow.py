@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of SENAITE.ABX.
+#
+# SENAITE.ABX is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the Free
+# Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, write to the Free Software Foundation, Inc., 51
+# Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+# Copyright 2020-2025 by it's authors.
+# Some rights reserved, see README and LICENSE.
+
+import time
+
+from bika.lims import api
+from bika.lims.workflow import doActionFor as do_action_for
+from senaite.abx import logger
+from senaite.abx.api import get_antibiotics_for_class
+from senaite.abx.importer import flush
+from senaite.core.catalog import SETUP_CATALOG
+
+# Number of objects transitioned before the indexing queue is processed
+BATCH_SIZE = 100
+
+
+def do_action_for_uids(action, uids, batch_size=BATCH_SIZE, commit=False,
+                       progress=None):
+    """Performs the transition to the objects of the setup catalog with the
+    UIDs passed in and returns the UIDs of the objects transitioned.
+
+    Objects are woken up batch by batch. The indexing queue is processed
+    after each batch and the transaction committed if commit is True. The
+    function progress, if any, is called with the number of UIDs processed
+    and the total after each batch
+    """
+    start = time.time()
+    batch_size = max(api.to_int(batch_size, BATCH_SIZE), 1)
+    total = len(uids)
+    transitioned = []
+    for num in range(0, total, batch_size):
+        batch = uids[num:num + batch_size]
+        for brain in api.search({"UID": batch}, SETUP_CATALOG):
+            obj = api.get_object(brain)
+            success, message = do_action_for(obj, action)
+            if success:
+                transitioned.append(api.get_uid(obj))
+        flush(commit=commit)
+        if progress:
+            progress(num + len(batch), total)
+
+    logger.info("Action '{}' for {} objects took {:.2f}s".format(
+        action, len(transitioned), time.time() - start))
+    return transitioned
+
+
+def deactivate_classes(uids, batch_size=BATCH_SIZE, commit=False,
+                       progress=None):
+    """Deactivates the antibiotic classes with the UIDs passed in together
+    with their active antibiotics, found through the antibiotic class
+    reference index. Returns the UIDs of the classes deactivated
+    """
+    classes = do_action_for_uids("deactivate", uids, batch_size=batch_size,
+                                 commit=commit, progress=progress)
+    if not classes:
+        return classes
+    brains = get_antibiotics_for_class(classes, active_only=True)
+    antibiotics = map(api.get_uid, brains)
+    do_action_for_uids("deactivate", antibiotics, batch_size=batch_size,
+                       commit=commit, progress=progress)
+    return classes